@@ -9,6 +9,6 @@ This module helps transform models into other models.
 
 from .model import Mapper
 from .fields import MapField
-from .structures import ConDict
+from .structures import ConDict, Lazy, MissingSource
 
-__all__ = ("Mapper", "MapField", "ConDict")
+__all__ = ("Mapper", "MapField", "ConDict", "Lazy", "MissingSource")
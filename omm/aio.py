@@ -0,0 +1,113 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""
+asyncio support.
+
+This module requires Python 3.7 or later, so it is excluded from the lint
+of Python 2 in tox.ini.
+"""
+
+import asyncio
+import inspect
+from .helper import MISSING
+from .structures import ConDict, Lazy, MissingSource, is_lazy
+
+
+def _pending(value):
+    return is_lazy(value) or inspect.isawaitable(value)
+
+
+def _awaitable(loop, value, executor):
+    if isinstance(value, Lazy):
+        return loop.run_in_executor(executor, value.loader)
+    if not inspect.isawaitable(value):
+        return asyncio.wrap_future(value, loop=loop)
+    return value
+
+
+async def prefetch_async(dct, keys=None, executor=None):
+    """
+    Resolve the pending sources of ConDict concurrently.
+
+    The awaitables are gathered with asyncio.gather, and the results replace
+    them. Future of concurrent.futures is wrapped, and the loader of Lazy
+    is run in the executor so that the event loop isn't blocked. The sources
+    that raise MissingSource are stored as missing, like ConDict.prefetch.
+
+    Parameters:
+        dct: ConDict to be resolved.
+        keys: The names or the fields to be resolved. By default, all the
+            keys are resolved.
+        executor: concurrent.futures.Executor to run the loaders of Lazy. By
+            default, the default executor of the event loop is used.
+
+    """
+    pending = dct._pending(keys, _pending)
+    if not pending:
+        return
+    loop = asyncio.get_running_loop()
+    results = await asyncio.gather(*[
+        _awaitable(loop, value, executor) for (_, value) in pending
+    ], return_exceptions=True)
+    for ((key, _), result) in zip(pending, results):
+        if isinstance(result, MissingSource):
+            dct.data[key] = MISSING
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            dct.data[key] = result
+
+
+class AsyncMixin(object):
+    """
+    The mixin that adds the coroutines to the mapper.
+
+    Put this class before Mapper, e.g. `class User(AsyncMixin, Mapper)`.
+    The values of ConDict connected to the mapper can be awaitables as well
+    as Lazy and Future.
+    """
+
+    async def to_dict_async(self, exclude_type="dict"):
+        """
+        Resolve the pending sources, and convert the schema into dict.
+
+        The pending sources of the fields are resolved concurrently with
+        prefetch_async. Then, the values are serialized by to_dict.
+
+        Parameters:
+            exclude_type: The type of exclusion.
+
+        """
+        root = self.connected_object
+        if isinstance(root, ConDict):
+            await prefetch_async(
+                root, self._field_table.names,
+                getattr(self, "prefetch_executor", None)
+            )
+        return self.to_dict(exclude_type)
+
+    @classmethod
+    async def from_json_async(cls, stream, chunk_size=65536, **kwargs):
+        """
+        Read JSON from the stream, and de-serialize it into the object.
+
+        Parameters:
+            stream: The object that has read coroutine like
+                asyncio.StreamReader, or JSON str / bytes. The stream is
+                read by chunk_size until EOF.
+            chunk_size: The maximum size to be read at once.
+            **kwargs: Any keyword arguments to be passed to from_json
+
+        """
+        if isinstance(stream, (str, bytes)):
+            return cls.from_json(stream, **kwargs)
+        chunks = []
+        while True:
+            chunk = await stream.read(chunk_size)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return cls.from_json(
+            chunks[0][:0].join(chunks) if chunks else "", **kwargs
+        )
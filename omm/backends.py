@@ -0,0 +1,133 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""JSON backends."""
+
+import json
+import timeit
+from collections import OrderedDict, namedtuple
+
+import six
+
+
+class JSONBackend(namedtuple(
+    "JSONBackend", ("name", "dumps", "dumps_bytes", "loads")
+)):
+    """
+    The functions to encode / decode JSON.
+
+    Attributes:
+        name: The name of the backend.
+        dumps: The function that encodes the object into JSON str.
+        dumps_bytes: The function that encodes the object into UTF-8 bytes.
+        loads: The function that decodes JSON str or bytes.
+
+    """
+
+    __slots__ = ()
+
+
+_backends = OrderedDict()
+
+
+def register_backend(name, dumps, loads, dumps_bytes=None):
+    """
+    Register JSON backend.
+
+    Parameters:
+        name: The name of the backend. The backend that has the same name is
+            replaced.
+        dumps: The function that encodes the object into JSON str. The
+            keyword arguments of Mapper.to_json are passed to it.
+        loads: The function that decodes JSON str or bytes. The keyword
+            arguments of Mapper.from_json are passed to it.
+        dumps_bytes: The function that encodes the object into UTF-8 bytes.
+            By default, the result of dumps is encoded.
+
+    """
+    if dumps_bytes is None:
+        def dumps_bytes(obj, **kwargs):
+            return dumps(obj, **kwargs).encode("utf-8")
+    _backends[name] = JSONBackend(name, dumps, dumps_bytes, loads)
+    return _backends[name]
+
+
+def get_backend(names="json"):
+    """
+    Return the first registered backend.
+
+    Parameters:
+        names: The name of the backend, or the tuple of the names in the
+            order of preference, e.g. ("orjson", "json").
+
+    """
+    if isinstance(names, six.string_types):
+        names = (names, )
+    for name in names:
+        if name in _backends:
+            return _backends[name]
+    raise ValueError(("None of the JSON backends is available: {}").format(
+        (", ").join(names)
+    ))
+
+
+def backend_names():
+    """Return the tuple of the names of the registered backends."""
+    return tuple(_backends)
+
+
+def benchmark(mapper, number=1000, names=None):
+    """
+    Measure the cost of each backend on the mapper.
+
+    The dict the mapper serializes for JSON is built once, and the cost of
+    encoding it, encoding it into bytes, and decoding the result is measured
+    for each backend.
+
+    Parameters:
+        mapper: The mapper connected to the data to be measured.
+        number: The number of the executions of each measurement.
+        names: The names of the backends to be measured. By default, all the
+            registered backends are measured.
+
+    Return Value:
+        The dict of the name of the backend -> the dict of "dumps",
+        "dumps_bytes" and "loads" -> the average seconds per call.
+
+    """
+    data = json.loads(mapper.to_json())
+    text = json.dumps(data)
+    result = OrderedDict()
+    for name in names or backend_names():
+        backend = get_backend(name)
+        result[name] = OrderedDict([
+            (kind, timeit.timeit(
+                lambda: fn(arg), number=number
+            ) / number) for (kind, fn, arg) in (
+                ("dumps", backend.dumps, data),
+                ("dumps_bytes", backend.dumps_bytes, data),
+                ("loads", backend.loads, text)
+            )
+        ])
+    return result
+
+
+register_backend("json", json.dumps, json.loads)
+
+try:
+    import ujson
+except ImportError:
+    pass
+else:
+    register_backend("ujson", ujson.dumps, ujson.loads)
+
+try:
+    import orjson
+except ImportError:
+    pass
+else:
+    register_backend(
+        "orjson", lambda obj, **kwargs: orjson.dumps(obj, **kwargs).decode(
+            "utf-8"
+        ), orjson.loads, orjson.dumps
+    )
@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Batched loading of ConDict sources."""
+
+from collections import OrderedDict
+from functools import partial
+from threading import RLock
+
+try:
+    from collections.abc import Mapping
+except ImportError:
+    from collections import Mapping
+
+from .helper import MISSING
+from .structures import Lazy, MissingSource
+
+
+class BatchLoader(object):
+    """
+    The loader that fetches the requested keys at once.
+
+    load returns Lazy for the key, which is put into ConDict. The keys are
+    queued until one of them is resolved, and then all the queued keys are
+    deduplicated and fetched by a single call of batch. Therefore, when the
+    ConDicts of many mappers are built before they are serialized, e.g. by
+    Mapper.to_dicts, each source is fetched once for all of them instead of
+    once per mapper. The results are cached until clear is called.
+
+    Attributes:
+        batch_fn: The function that takes the list of the keys and returns
+            the list of the values in the same order, or the mapping of the
+            key -> the value. The keys missing from the mapping are treated
+            as missing sources.
+        max_batch_size: The maximum number of the keys passed to batch_fn
+            at once. By default, all the queued keys are passed.
+
+    """
+
+    def __init__(self, batch_fn=None, max_batch_size=None):
+        """
+        Init the loader.
+
+        Parameters:
+            batch_fn: The function to fetch the values of the keys. If this
+                is None, batch must be overridden.
+            max_batch_size: The maximum number of the keys fetched at once.
+
+        """
+        self.batch_fn = batch_fn
+        self.max_batch_size = max_batch_size
+        self.__queue = OrderedDict()
+        self.__cache = {}
+        self.__lock = RLock()
+
+    def batch(self, keys):
+        """
+        Fetch the values of the keys.
+
+        Parameters:
+            keys: The list of the unique keys.
+
+        Return Value:
+            The list of the values in the order of the keys, or the mapping
+            of the key -> the value.
+
+        """
+        return self.batch_fn(keys)
+
+    def load(self, key):
+        """
+        Queue the key.
+
+        Parameters:
+            key: The hashable key of the source.
+
+        Return Value:
+            Lazy that returns the value of the key. If the value is missing,
+            MissingSource is raised, i.e. the fields of the source are
+            treated as unresolved.
+
+        """
+        with self.__lock:
+            if key not in self.__cache:
+                self.__queue[key] = None
+        return Lazy(partial(self.get, key))
+
+    def __fetch(self, keys):
+        values = self.batch(keys)
+        if isinstance(values, Mapping):
+            values = [values.get(key, MISSING) for key in keys]
+        self.__cache.update(zip(keys, values))
+
+    def __dispatch(self):
+        keys = list(self.__queue)
+        self.__queue.clear()
+        size = self.max_batch_size or len(keys)
+        for start in range(0, len(keys), size):
+            self.__fetch(keys[start:start + size])
+
+    def dispatch(self):
+        """Fetch all the queued keys."""
+        with self.__lock:
+            self.__dispatch()
+
+    def get(self, key):
+        """
+        Return the value of the key.
+
+        If the value isn't fetched yet, it is fetched with all the queued
+        keys.
+
+        Parameters:
+            key: The key of the source.
+
+        """
+        with self.__lock:
+            if key not in self.__cache:
+                self.__queue[key] = None
+                self.__dispatch()
+            value = self.__cache.get(key, MISSING)
+        if value is MISSING:
+            raise MissingSource(key)
+        return value
+
+    def clear(self):
+        """Clear the cached values."""
+        with self.__lock:
+            self.__cache.clear()
+
+
+class DictLoader(BatchLoader):
+    """
+    BatchLoader that fetches the values from the dict.
+
+    This is useful for testing.
+
+    Attributes:
+        data: The dict of the key -> the value.
+        calls: The list of the keys passed to each batch call.
+
+    """
+
+    def __init__(self, data, max_batch_size=None):
+        """
+        Init the loader.
+
+        Parameters:
+            data: The dict of the key -> the value.
+            max_batch_size: The maximum number of the keys fetched at once.
+
+        """
+        super(DictLoader, self).__init__(max_batch_size=max_batch_size)
+        self.data = data
+        self.calls = []
+
+    def batch(self, keys):
+        """Return the values of the keys in the dict."""
+        self.calls.append(list(keys))
+        return dict([
+            (key, self.data[key]) for key in keys if key in self.data
+        ])
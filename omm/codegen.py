@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Source code generation of the compiled accessors."""
+
+import itertools
+import json
+import keyword
+import linecache
+import re
+
+import six
+
+from .helper import MISSING, extend_list
+from .path import create, get_or_create
+
+_identifier_pattern = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+_counter = itertools.count()
+
+
+def compile_function(name, source, namespace, label):
+    """
+    Compile the function, and register its source to linecache.
+
+    Registering the source, tracebacks and profilers can show the generated
+    code as if it were in a file.
+
+    Parameters:
+        name: The name of the function defined in the source.
+        source: The source code.
+        namespace: The global namespace of the function.
+        label: Human-readable description of the function that is put into
+            the file name.
+
+    """
+    filename = ("<omm-generated-{} {}>").format(next(_counter), label)
+    linecache.cache[filename] = (
+        len(source), None, source.splitlines(True), filename
+    )
+    six.exec_(compile(source, filename, "exec"), namespace)
+    return namespace[name]
+
+
+def is_identifier(name):
+    """
+    Check whether the name can be written as an attribute in the source.
+
+    Parameters:
+        name: The name to check.
+
+    """
+    return bool(_identifier_pattern.match(name)) and \
+        not keyword.iskeyword(name)
+
+
+def attr_expr(var, name):
+    """
+    Return the expression that gets the attribute.
+
+    Parameters:
+        var: The variable name of the object.
+        name: The attribute name.
+
+    """
+    if is_identifier(name):
+        return ("{}.{}").format(var, name)
+    return ("getattr({}, {!r})").format(var, name)
+
+
+def lookup_expr(var, step):
+    """
+    Return the expression that resolves the step.
+
+    Parameters:
+        var: The variable name of the object, dict, or list.
+        step: PathStep to resolve.
+
+    """
+    if step.is_index:
+        return ("{}[{!r}]").format(var, step.key)
+    return ("{0}[{1!r}] if isinstance({0}, dict) else {2}").format(
+        var, step.key, attr_expr(var, step.key)
+    )
+
+
+def generate_getter(plan):
+    """
+    Generate the function that works as path.get_value(plan, data).
+
+    Parameters:
+        plan: PathPlan to resolve.
+
+    """
+    lines = ["def get_value(data):"] + [
+        ("    data = {}").format(lookup_expr("data", step))
+        for step in plan.steps
+    ] + ["    return data", ""]
+    return compile_function(
+        "get_value", ("\n").join(lines), {},
+        ("get {}").format(plan.target)
+    )
+
+
+def _create_lines(steps, index):
+    step = steps[index]
+    if step.is_index:
+        return [(
+            "    node = get_or_create("
+            "node, steps[{0}], steps[{1}], obj_types[{1}])"
+        ).format(index, index + 1)]
+    return [
+        "    try:",
+        ("        child = {}").format(lookup_expr("node", step)),
+        "    except (AttributeError, KeyError):",
+        "        child = None",
+        "    if child is None:",
+        (
+            "        child = create("
+            "node, steps[{0}], steps[{1}], obj_types[{1}])"
+        ).format(index, index + 1),
+        "    node = child"
+    ]
+
+
+def _assign_lines(step):
+    lines = [] if step.cast is None else [
+        "    if type(value) is not cast:",
+        "        value = cast(value)"
+    ]
+    if step.is_index:
+        return lines + [
+            ("    extend_list(node, {!r})").format(step.key),
+            ("    node[{!r}] = value").format(step.key)
+        ]
+    return lines + [
+        "    if isinstance(node, dict):",
+        ("        node[{!r}] = value").format(step.key),
+        "    else:",
+        ("        node.{} = value").format(step.key)
+        if is_identifier(step.key) else
+        ("        setattr(node, {!r}, value)").format(step.key)
+    ]
+
+
+def generate_setter(plan):
+    """
+    Generate the function that works as path.set_value(plan, ...).
+
+    Parameters:
+        plan: PathPlan to resolve.
+
+    """
+    steps = plan.steps
+    lines = ["def set_value(node, value, obj_types):"] + [
+        line for index in range(len(steps) - 1)
+        for line in _create_lines(steps, index)
+    ] + _assign_lines(steps[-1]) + [""]
+    return compile_function(
+        "set_value", ("\n").join(lines), {
+            "steps": steps, "cast": steps[-1].cast, "create": create,
+            "get_or_create": get_or_create, "extend_list": extend_list
+        }, ("set {}").format(plan.target)
+    )
+
+
+def generate_serializer(entries, serialize, label):
+    """
+    Generate the function that serializes the values into a dict.
+
+    The generated function takes the tuple of the values returned by the
+    reader, and skips the values that are helper.MISSING.
+
+    Parameters:
+        entries: The list of (index, name). index is the position of the
+            value in the tuple, and name is the key of the result.
+        serialize: The function that serializes each value, e.g.
+            helper.HookDispatcher.
+        label: Human-readable description of the function.
+
+    """
+    lines = ["def serialize(values):", "    dct = {}"]
+    for (index, name) in entries:
+        lines.extend([
+            ("    value = values[{}]").format(index),
+            "    if value is not missing:",
+            ("        dct[{!r}] = serialize_value(value)").format(name)
+        ])
+    lines.extend(["    return dct", ""])
+    return compile_function(
+        "serialize", ("\n").join(lines),
+        {"serialize_value": serialize, "missing": MISSING}, label
+    )
+
+
+def generate_json_writer(entries, serialize, encode, label):
+    """
+    Generate the function that writes the values as a JSON object.
+
+    The generated function takes the tuple of the values returned by the
+    reader and the function that writes a str fragment. The keys are
+    escaped when the function is generated, and the values that are
+    helper.MISSING are skipped. The fragments are the same as the result of
+    json.dumps with the default separators.
+
+    Parameters:
+        entries: The list of (index, name). index is the position of the
+            value in the tuple, and name is the key of the result.
+        serialize: The function that serializes each value, e.g.
+            helper.HookDispatcher.
+        encode: The function that encodes the serialized value into JSON.
+        label: Human-readable description of the function.
+
+    """
+    lines = ["def write_json(values, write):", "    sep = '{'"]
+    for (index, name) in entries:
+        lines.extend([
+            ("    value = values[{}]").format(index),
+            "    if value is not missing:",
+            (
+                "        write(sep + {!r} + encode(serialize_value(value)))"
+            ).format(json.dumps(name) + ": "),
+            "        sep = ', '"
+        ])
+    lines.extend(["    write('{}' if sep == '{' else '}')", ""])
+    return compile_function(
+        "write_json", ("\n").join(lines), {
+            "serialize_value": serialize, "encode": encode, "missing": MISSING
+        }, label
+    )
+
+
+def _loader_lines(index, name, hook, direct):
+    lines = [
+        ("    value = get({!r}, missing)").format(name),
+        "    if value is not missing:"
+    ]
+    if hook:
+        arg = ("{{{!r}: value}}").format(name)
+        if hook[1]:
+            arg = ("pre_process_{}({})").format(index, arg)
+        lines.append(
+            ("        value = cast_{}.{}({})").format(index, hook[0], arg)
+        )
+    if direct:
+        return lines + [("        values[{}] = value").format(index)]
+    if is_identifier(name):
+        return lines + [("        mapper.{} = value").format(name)]
+    return lines + [("        setattr(mapper, {!r}, value)").format(name)]
+
+
+def generate_loader(entries, label):
+    """
+    Generate the function that puts the values of the dict to the mapper.
+
+    The generated function takes the mapper, the dict, and the function
+    that writes the values. The values to write are passed to the function
+    at once as a dict of field index -> value.
+
+    Parameters:
+        entries: The list of (index, name, cast, hook, direct).
+            index is the position of the field, name is the name of the
+            field, cast is the type to restore the value, and hook is the
+            deserialization hook of the cast found by
+            helper.find_deserializer. direct is False if the value should be
+            set through the descriptor instead of the write function.
+        label: Human-readable description of the function.
+
+    """
+    namespace = {"missing": MISSING}
+    lines = [
+        "def load(mapper, dct, write):",
+        "    get = dct.get",
+        "    values = {}"
+    ]
+    for (index, name, cast, hook, direct) in entries:
+        namespace.update([
+            (("cast_{}").format(index), cast),
+            (("pre_process_{}").format(index), hook and hook[1])
+        ])
+        lines.extend(_loader_lines(index, name, hook, direct))
+    lines.extend([
+        "    if values:",
+        "        write(mapper, values)",
+        "    return mapper",
+        ""
+    ])
+    return compile_function("load", ("\n").join(lines), namespace, label)
+
+
+def _reader_lines(node, parent, counter, leaves, keys):
+    lines = []
+    for child in node.children.values():
+        if child.descendants.isdisjoint(keys):
+            continue
+        var = ("n{}").format(next(counter))
+        lines.extend([
+            ("    {} = missing").format(var),
+            ("    if {} is not missing:").format(parent),
+            "        try:",
+            ("            {} = {}").format(
+                var, lookup_expr(parent, child.step)
+            ),
+            "        except AttributeError:",
+            "            pass"
+        ])
+        leaves.update((index, var) for index in child.fields)
+        lines.extend(_reader_lines(child, var, counter, leaves, keys))
+    return lines
+
+
+def _value_lines(index, name, get_cast, leaf):
+    var = ("v{}").format(index)
+    if leaf is None:
+        return [
+            "    try:",
+            ("        {} = {}").format(var, attr_expr("mapper", name)),
+            "    except AttributeError:",
+            ("        {} = missing").format(var)
+        ]
+    lines = [("    {} = {}").format(var, leaf)]
+    if get_cast is not None:
+        lines.extend([
+            ("    if {0} is not missing and not isinstance({0}, {1}):").format(
+                var, ("get_cast_{}").format(index)
+            ),
+            ("        {0} = get_cast_{1}({0})").format(var, index)
+        ])
+    return lines
+
+
+def generate_reader(trie, entries, label, indexes=None):
+    """
+    Generate the function that reads the fields in one pass.
+
+    The generated function takes the mapper and the root object, and
+    returns the tuple of the values in the order of the entries. The values
+    that can't be resolved are helper.MISSING. Because the intermediate
+    objects are resolved by walking the prefix tree, the shared
+    intermediate objects are resolved exactly once.
+
+    Parameters:
+        trie: trie.TrieNode built from the plans of the entries.
+        entries: The list of (name, get_cast). get_cast is None if the field
+            doesn't have get_cast.
+        label: Human-readable description of the function.
+        indexes: The positions of the fields to read. The other fields
+            aren't looked up, and their values are helper.MISSING. By
+            default, all the fields are read.
+
+    """
+    keys = frozenset(range(len(entries)) if indexes is None else indexes)
+    leaves = {}
+    lines = ["def read(mapper, n0):"] + _reader_lines(
+        trie, "n0", itertools.count(1), leaves, keys
+    )
+    namespace = {"missing": MISSING}
+    for (index, (name, get_cast)) in enumerate(entries):
+        if index not in keys:
+            lines.append(("    v{} = missing").format(index))
+            continue
+        namespace[("get_cast_{}").format(index)] = get_cast
+        lines.extend(_value_lines(index, name, get_cast, leaves.get(index)))
+    lines.extend([
+        ("    return ({})").format(("").join(
+            ("v{}, ").format(index) for index in range(len(entries))
+        ).rstrip()), ""
+    ])
+    return compile_function("read", ("\n").join(lines), namespace, label)
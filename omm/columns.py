@@ -0,0 +1,180 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Columnar (struct-of-arrays) conversion."""
+
+import array
+import math
+
+from .helper import MISSING
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    array.array("q")
+    _typecodes = {float: "d", int: "q"}
+except ValueError:
+    _typecodes = {float: "d", int: "l"}
+
+
+def leaf_cast(field):
+    """
+    Return the type the field casts its value into.
+
+    Parameters:
+        field: The field.
+
+    Return Value:
+        The last element of set_cast if set_cast is a list, set_cast if it
+        is specified otherwise, or None.
+
+    """
+    set_cast = getattr(field, "set_cast", None)
+    if isinstance(set_cast, list):
+        return set_cast[-1] if set_cast else None
+    return set_cast
+
+
+def value_cast(field):
+    """
+    Return the type of the values the mapper reads from the field.
+
+    Parameters:
+        field: The field.
+
+    Return Value:
+        get_cast if the field has it, because the values are casted by
+        get_cast when they are read. Otherwise, the result of leaf_cast.
+
+    """
+    if hasattr(field, "get_cast"):
+        return field.get_cast
+    return leaf_cast(field)
+
+
+def _numeric_column(values, typecode, missing):
+    values = [missing if value is MISSING else value for value in values]
+    if numpy is not None:
+        return numpy.array(values, dtype=typecode)
+    return array.array(typecode, values)
+
+
+def make_column(values, cast=None):
+    """
+    Make the column from the values.
+
+    Parameters:
+        values: The sequence of the values of a field. helper.MISSING means
+            the value couldn't be resolved.
+        cast: The type the field casts its value into.
+
+    Return Value:
+        If cast is float or int, the NumPy array of float64 / int64 if NumPy
+        is installed, or array.array otherwise. The missing values in a
+        float column are NaN. If the values can't be put into such an array,
+        e.g. an int column has missing values, or cast is another type, the
+        list of the values whose missing values are None.
+
+    """
+    typecode = _typecodes.get(cast)
+    if typecode is not None:
+        try:
+            return _numeric_column(
+                values, typecode, float("nan") if cast is float else MISSING
+            )
+        except (TypeError, ValueError, OverflowError):
+            pass
+    return [None if value is MISSING else value for value in values]
+
+
+def _is_nan(value):
+    return isinstance(value, float) and math.isnan(value)
+
+
+def _cast_values(values, cast):
+    if cast is None:
+        return values
+    if None in values:
+        return [value if value is None else cast(value) for value in values]
+    return list(map(cast, values))
+
+
+def _cast_array(column, cast):
+    if column.dtype.kind == "f":
+        missing = numpy.flatnonzero(numpy.isnan(column))
+        if missing.size:
+            values = column.tolist()
+            for index in missing.tolist():
+                values[index] = None
+            return _cast_values(values, cast)
+    if cast in _typecodes and column.dtype.kind in "biuf":
+        return column.astype(_typecodes[cast]).tolist()
+    return _cast_values(column.tolist(), cast)
+
+
+def cast_column(column, cast=None):
+    """
+    Cast the values of the column at once.
+
+    If the column is NumPy array of numbers and cast is float or int, the
+    values are casted by NumPy, and the missing values are found by the
+    mask of NaN, so that the values aren't checked one by one.
+
+    Parameters:
+        column: The list, array.array, or NumPy array of the values. None
+            and NaN mean the value is missing, like the columns made by
+            make_column.
+        cast: The type to cast the values into. None if the values should be
+            kept as they are.
+
+    Return Value:
+        The list of the casted values. The missing values are None.
+
+    """
+    if numpy is not None and isinstance(column, numpy.ndarray):
+        return _cast_array(column, cast)
+    return _cast_values([
+        None if _is_nan(value) else value for value in column
+    ], cast)
+
+
+_numpy_types = {float: "f8", int: "i8", bool: "?"}
+
+
+def require_numpy():
+    """Return numpy module, or raise ImportError if it's not installed."""
+    if numpy is None:
+        raise ImportError("NumPy is required to use structured arrays.")
+    return numpy
+
+
+def field_dtype(field):
+    """
+    Return NumPy dtype of the field.
+
+    Parameters:
+        field: The field. If the field has dtype attribute (e.g.
+            MapField("name", set_cast=str, dtype="U16")), it is used.
+            Otherwise, the dtype is derived from the type of the values read
+            from the field (see value_cast), which must be float, int, bool,
+            or a NumPy scalar type.
+
+    """
+    np = require_numpy()
+    dtype = getattr(field, "dtype", None)
+    if dtype is not None:
+        return np.dtype(dtype)
+    cast = value_cast(field)
+    if cast in _numpy_types:
+        return np.dtype(_numpy_types[cast])
+    if isinstance(cast, type) and issubclass(cast, np.generic) and \
+            np.dtype(cast).itemsize:
+        return np.dtype(cast)
+    raise TypeError((
+        "The type of \"{}\" can't be put into a structured array. "
+        "Specify the numeric set_cast, or dtype of the field, "
+        "e.g. dtype=\"U16\"."
+    ).format(field.name))
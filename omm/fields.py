@@ -3,11 +3,14 @@
 
 """Fields."""
 
-import re
-from functools import reduce
+from functools import partial, reduce
+from weakref import WeakSet
+
+from .codegen import generate_getter, generate_setter
 from .helper import (
-    reduce_with_index, shrink_list, delete_elem, safe_delete_array_elem
+    shrink_list, delete_elem, is_empty, safe_delete_array_elem
 )
+from .path import PathSegment, compile_path, get_value, set_value
 
 
 class FieldBase(object):
@@ -16,17 +19,83 @@ class FieldBase(object):
 
     This shouldn't be used for end-use, but all OMM fields should
     inhert this base field.
+
+    Attributes:
+        name: The name of the attribute the field is bound to. This is set
+            by the mapper when the field is put to the mapper class.
+
     """
 
-    pass
+    name = None
+    __mapper_attrs__ = (
+        "_target", "sep_char", "set_cast", "get_cast",
+        "exclude", "exclude_serialize", "exclude_deserialize"
+    )
+
+    def __set_name__(self, owner, name):
+        """
+        Set the name of the attribute the field is bound to.
+
+        Parameters:
+            owner: The class the field is put to.
+            name: The name of the attribute.
+
+        """
+        self.name = name
+
+    def _add_owner(self, owner):
+        """
+        Record the mapper class that uses the field.
+
+        The compiled functions of the owners are discarded when the options
+        of the field are changed. This is called by the mapper class for
+        each field it collects, including the inherited ones.
+
+        Parameters:
+            owner: The mapper class.
+
+        """
+        if "_owners" not in self.__dict__:
+            self._owners = WeakSet()
+        self._owners.add(owner)
+
+    def __update_owners(self, attr):
+        if attr in self.__mapper_attrs__:
+            for owner in list(self.__dict__.get("_owners", ())):
+                update = getattr(owner, "_update_fields", None)
+                if update is not None:
+                    update()
+
+    def __setattr__(self, attr, value):
+        """Set the attribute, and update the owners if needed."""
+        super(FieldBase, self).__setattr__(attr, value)
+        self.__update_owners(attr)
+
+    def __delattr__(self, attr):
+        """Delete the attribute, and update the owners if needed."""
+        super(FieldBase, self).__delattr__(attr)
+        self.__update_owners(attr)
+
+    def compile(self, codegen=None):
+        """
+        Prepare the field for the mapper.
+
+        This is called when the mapper class is created. By default, this
+        method does nothing.
+
+        Parameters:
+            codegen: Set True if the mapper wants the field to generate
+                specialized source code.
+
+        """
+        pass
 
 
 class MapField(FieldBase):
     """Normal Map Field."""
 
-    __index_find_pattern__ = re.compile(r"\[([0-9])+\]+")
     __NotSpecifiedYet__ = type("__NotSpecifiedYet__", (object, ), {})
-    __GeneratedObject__ = type("__GeneratedObject__", (object, ), {})
+    __plan_attrs__ = ("_target", "sep_char", "set_cast")
 
     def __init__(self, target=None, **kwargs):
         """
@@ -66,6 +135,10 @@ class MapField(FieldBase):
                 if you want to exclude this field from serialization.
             exclude_deserialize: Set True or the dict described above
                 if you want to exclude this field from deserialization.
+                Note that the mappers cache the exclusion until the options
+                are set again, so assign a new dict to change the exclusion
+                instead of modifying the dict in place, e.g.
+                `field.exclude = dict(field.exclude, json=False)`.
             sep_char: Seperation character. Note that this can be
                 multiple characters. By default, the value is '.'
             (Other arguments): They are treated as meta-data.
@@ -77,25 +150,76 @@ class MapField(FieldBase):
         for (attr, value) in kwargs.items():
             setattr(self, attr, value)
 
-    def __split_name_index(self, attr):
-        index = [
-            int(value)
-            for value in self.__index_find_pattern__.findall(attr)
-        ]
-        name = self.__index_find_pattern__.sub("", attr)
-        return (name, index)
-
-    def __lookup(self, data, attr):
-        (name, index) = self.__split_name_index(attr)
-        result = data[name] if isinstance(data, dict) else getattr(data, name)
-        if index:
-            result = reduce(lambda v, i: v[i], index, result)
-        return result
+    def __setattr__(self, attr, value):
+        """Set the attribute, and discard the compiled plan if needed."""
+        if attr in self.__plan_attrs__:
+            self.__dict__.pop("_compiled", None)
+        super(MapField, self).__setattr__(attr, value)
+
+    def __delattr__(self, attr):
+        """Delete the attribute, and discard the compiled plan if needed."""
+        if attr in self.__plan_attrs__:
+            self.__dict__.pop("_compiled", None)
+        super(MapField, self).__delattr__(attr)
+
+    def compile(self, codegen=None):
+        """
+        Compile the target into PathPlan.
+
+        Usually, this is called by the mapper when the mapper class is
+        created, and the plan is re-compiled when target, sep_char, or
+        set_cast is changed.
+
+        Parameters:
+            codegen: Set True to generate the getter and the setter
+                specialized for the target as Python source code, instead of
+                walking the plan step by step. When this is None, the
+                previous mode is kept. By default, the mode is False.
+
+        """
+        if codegen is not None:
+            self._codegen = codegen
+        set_cast = getattr(self, "set_cast", None)
+        plan = compile_path(self.target, self.sep_char, set_cast)
+        error = None
+        if isinstance(set_cast, list) and len(set_cast) != plan.num_cast:
+            error = ("The number of set_cast must be {}, not {}").format(
+                plan.num_cast, len(set_cast)
+            )
+        self._compiled = (plan, ) + ((
+            generate_getter(plan), generate_setter(plan)
+        ) if getattr(self, "_codegen", False) else (
+            partial(get_value, plan), partial(set_value, plan)
+        )) + (error, )
+        return plan
+
+    @property
+    def __compiled(self):
+        try:
+            return self._compiled
+        except AttributeError:
+            self.compile()
+            return self._compiled
+
+    @property
+    def plan(self):
+        """Return the compiled target."""
+        return self.__compiled[0]
+
+    @staticmethod
+    def __lookup(data, segment):
+        result = data[segment.name] if isinstance(data, dict) \
+            else getattr(data, segment.name)
+        return reduce(lambda v, i: v[i], segment.indexes, result)
+
+    def __key(self, mapper_instance):
+        return type(mapper_instance)._field_names.get(self, self.name)
 
     def __get_connected_object(self, mapper_instance):
         from .structures import ConDict
         cobj = mapper_instance.connected_object
-        return cobj[self] if isinstance(cobj, ConDict) else cobj
+        return cobj[self.__key(mapper_instance)] \
+            if isinstance(cobj, ConDict) else cobj
 
     def __get__(self, obj, cls=None):
         """Get descriptor."""
@@ -108,8 +232,7 @@ class MapField(FieldBase):
             data = self.__get_connected_object(obj)
         except KeyError:
             data = None
-        attrs = self.target.split(self.sep_char)
-        ret = reduce(self.__lookup, attrs, data)
+        ret = self.__compiled[1](data)
         if hasattr(self, "get_cast") and not isinstance(ret, self.get_cast):
             ret = self.get_cast(ret)
         return ret
@@ -118,38 +241,33 @@ class MapField(FieldBase):
         try:
             obj = reduce(self.__lookup, target_route[:-1], target)
             parent_obj = reduce(self.__lookup, target_route[:-2], target)
-            (name, index) = self.__split_name_index(target_route[-1])
+            (name, index) = target_route[-1]
             if index:
                 parent_obj = obj
-                obj = self.__lookup(obj, name)
+                obj = self.__lookup(obj, PathSegment(name, ()))
                 parent_obj = reduce(lambda v, i: v[i], index[:-2], obj)
                 obj = reduce(lambda v, i: v[i], index[:-1], obj)
 
                 safe_delete_array_elem(obj, index[-1])
 
                 if getattr(self, "clear_parent", False):
-                    is_empty = all(
+                    is_cleared = all(
                         [el is None for el in obj] + [
                             isinstance(parent_obj, list)
                         ]
                     )
-                    if is_empty:
+                    if is_cleared:
                         safe_delete_array_elem(parent_obj, index[-2])
                     shrink_list(parent_obj)
                     if not parent_obj:
                         self.__delete_attr(
                             target,
-                            target_route[:-1] + [name]
+                            target_route[:-1] + (PathSegment(name, ()), )
                         )
             else:
-                delete_elem(obj, target_route[-1])
+                delete_elem(obj, name)
                 if getattr(self, "clear_parent", False):
-                    is_empty = not(
-                        bool(obj)
-                        if isinstance(obj, dict) else
-                        bool(obj.__dict__)
-                    )
-                    if all([is_empty, target_route[:-1]]):
+                    if all([is_empty(obj), target_route[:-1]]):
                         self.__delete_attr(target, target_route[:-1])
         except (AttributeError, KeyError):
             return
@@ -157,8 +275,7 @@ class MapField(FieldBase):
     def __delete__(self, instance):
         """Delete descriptor."""
         target = self.__get_connected_object(instance)
-        target_route = self.target.split(self.sep_char)
-        self.__delete_attr(target, target_route)
+        self.__delete_attr(target, self.plan.segments)
 
     def _cast_type(self, index, default=__NotSpecifiedYet__, index_only=False):
         ret = None
@@ -174,122 +291,32 @@ class MapField(FieldBase):
             ret = default
         return ret
 
-    def __correct_value(self, target, indexes, value):
-        result_value = value
-        if hasattr(self, "set_cast"):
-            cast = self._cast_type(-1, None)
-            if not any([cast is None, type(result_value) is cast]):
-                result_value = cast(result_value)
-        return target if isinstance(target, list) \
-            else [] if indexes else result_value
-
-    def __allocate_array(self, asdict, target, attr, current_position,
-                         indexes, value=None):
-        point = target[attr] if isinstance(target, dict) \
-            else getattr(target, attr)
-        for (num, index) in enumerate(indexes):
-            cast = self._cast_type(
-                current_position + num + 2,
-                dict if asdict else self.__GeneratedObject__, True
-            )
-            point.extend([None] * (index - len(point) + 1))
-            point[index] = (
-                value if value is not None else cast()
-            ) if num + 1 == len(indexes) else point[index] if isinstance(
-                point[index], list
-            ) else cast() if issubclass(cast, list) else []
-            point = point[index]
-        return point
-
     def validate(self):
         """
         Validate the field.
 
-        If the validation is failed, ValueError is raised.
+        If the validation is failed, ValueError is raised. The result is
+        computed when the target is compiled, so calling this method doesn't
+        parse the target again.
         """
-        attrs = self.target.split(self.sep_char)
-        num_cast = len(attrs) + len(
-            self.__index_find_pattern__.findall(self.target)
-        ) + 1
-        if isinstance(getattr(self, "set_cast", None), list) and \
-                len(self.set_cast) != num_cast:
-            raise ValueError(
-                ("The number of set_cast must be {}, not {}").format(
-                    num_cast, len(self.set_cast)
-                )
-            )
+        error = self.__compiled[3]
+        if error is not None:
+            raise ValueError(error)
 
     def __set__(self, obj, value):
         """Set descriptor."""
-        attrs = self.target.split(self.sep_char)
         self.validate()
-        asdict = getattr(obj, "asdict", False)
-        GeneratedObject = type("GeneratedObject", (object, ), {})
-
-        def get_or_create(target_delay, attr, cur_pos):
-            (target, delay) = target_delay
-            indexes = [
-                int(value)
-                for value in self.__index_find_pattern__.findall(attr)
-            ]
-            actual_attr = self.__index_find_pattern__.sub("", attr)
-            result = None
-            try:
-                result = self.__allocate_array(
-                    asdict, target, actual_attr, cur_pos, indexes
-                )
-            except AttributeError:
-                cast = self._cast_type(cur_pos + delay + 1, GeneratedObject)
-                setattr(
-                    target, actual_attr,
-                    [] if indexes and not issubclass(cast, list) else cast()
-                )
-                result = self.__allocate_array(
-                    asdict, target, actual_attr, cur_pos, indexes
-                )
-            except KeyError:
-                cast = self._cast_type(cur_pos + delay + 1, dict)
-                target[actual_attr] = [
-                ] if indexes and not issubclass(cast, list) else cast()
-                result = self.__allocate_array(
-                    asdict, target, actual_attr, cur_pos, indexes
-                )
-            return (result, delay + len(indexes))
-
+        (plan, _, setter, _) = self.__compiled
+        obj_types = obj._object_types(self)
+        root_type = plan.root_cast or obj_types[0]
         try:
-            if not self.__get_connected_object(obj):
-                obj.connect(
-                    self._cast_type(0, dict if asdict else GeneratedObject)()
-                )
+            root = self.__get_connected_object(obj)
+            if root is None:
+                root = root_type()
+                obj.connect(root)
         except KeyError:
-            index = list(obj.fields.values()).index(self)
-            field_name = list(obj.fields.keys())[index]
-            obj.connected_object[field_name] = self._cast_type(
-                0, dict if asdict else GeneratedObject
-            )()
-        last_indexes = [
-            int(index_str)
-            for index_str in self.__index_find_pattern__.findall(attrs[-1])
-        ]
-        last_attr = self.__index_find_pattern__.sub("", attrs[-1])
-        target_obj = reduce_with_index(
-            get_or_create, attrs[:-1], (self.__get_connected_object(obj), 0)
-        )[0]
-        if isinstance(target_obj, dict):
-            target_obj[last_attr] = self.__correct_value(
-                target_obj.get(last_attr, None),
-                last_indexes, value
-            )
-        else:
-            setattr(
-                target_obj, last_attr, self.__correct_value(
-                    getattr(target_obj, last_attr, None),
-                    last_indexes, value
-                )
-            )
-        self.__allocate_array(
-            asdict, target_obj, last_attr, -1, last_indexes, value
-        )
+            root = obj.connected_object[self.__key(obj)] = root_type()
+        setter(root, value, obj_types)
 
     @property
     def target(self):
@@ -4,6 +4,17 @@
 """Helper functions."""
 
 
+class Missing(object):
+    """The type of MISSING."""
+
+    def __repr__(self):
+        """Return the representation."""
+        return "MISSING"
+
+
+MISSING = Missing()
+
+
 def reduce_with_index(fn, iterable, start=None, *args, **kwargs):
     """
     Wrap functools.reduce, but this function puts index to fn.
@@ -75,6 +86,26 @@ def delete_elem(target, name):
         delattr(target, name)
 
 
+def is_empty(target):
+    """
+    Check whether the dict or the object has no elements / attributes.
+
+    Parameters:
+        target: The target object or dict. The attributes stored in
+            __slots__ are taken into account.
+
+    """
+    if isinstance(target, dict):
+        return not target
+    if getattr(target, "__dict__", None):
+        return False
+    return not any(
+        hasattr(target, slot) for cls in type(target).__mro__
+        for slot in getattr(cls, "__slots__", ())
+        if slot not in ("__dict__", "__weakref__")
+    )
+
+
 def safe_delete_array_elem(target, index):
     """
     Unset array element safely.
@@ -88,3 +119,139 @@ def safe_delete_array_elem(target, index):
         del target[index]
     else:
         target[index] = None
+
+
+def extend_list(target, index):
+    """
+    Extend the list with None so that the index is available.
+
+    Parameters:
+        target: The target list.
+        index: The index that should be available.
+
+    CAUTION:
+        This function is destroyable operation.
+
+    """
+    target.extend([None] * (index - len(target) + 1))
+    return target
+
+
+def join_chunks(fragments, chunk_size):
+    """
+    Join the str fragments into the chunks of about chunk_size.
+
+    Parameters:
+        fragments: The iterable of the str fragments.
+        chunk_size: The minimum length of each chunk, except the last one.
+
+    Return Value:
+        The generator of the chunks. Empty chunks are never generated.
+
+    """
+    (chunk, size) = ([], 0)
+    for fragment in fragments:
+        chunk.append(fragment)
+        size += len(fragment)
+        if size >= chunk_size:
+            yield ("").join(chunk)
+            (chunk, size) = ([], 0)
+    if size:
+        yield ("").join(chunk)
+
+
+class HookDispatcher(object):
+    """
+    Serialize the values with the first hook the type of the value has.
+
+    The hook of each type is looked up once and remembered, so that the
+    plain values like int or str are returned without raising and catching
+    AttributeError. If the type doesn't have any of the hooks, but its
+    instances can have their own attributes, i.e. they have __dict__ or the
+    type defines __getattr__ like proxies, the hooks are looked up from each
+    instance instead.
+    """
+
+    def __init__(self, hooks):
+        """
+        Init the dispatcher.
+
+        Parameters:
+            hooks: The tuple of (post-process function, method name). For
+                example, ((json.loads, "to_json"), (None, "to_dict")) means
+                "call value.to_json() and parse its result with json.loads,
+                or call value.to_dict() if value doesn't have to_json."
+                If the value doesn't have any of them, the value itself is
+                returned.
+
+        """
+        self.hooks = hooks
+        self.memo = {}
+
+    def find(self, value_type):
+        """
+        Find the hook the type has.
+
+        Parameters:
+            value_type: The type of the value, or the value itself to find
+                the hook from its own attributes.
+
+        Return Value:
+            (post-process function, method name), or None if the type
+            doesn't have any of the hooks.
+
+        """
+        for (post_process, method_name) in self.hooks:
+            if hasattr(value_type, method_name):
+                return (post_process, method_name)
+        return None
+
+    @staticmethod
+    def __has_own_attrs(value):
+        return hasattr(value, "__dict__") or \
+            hasattr(type(value), "__getattr__")
+
+    def __call__(self, value):
+        """
+        Serialize the value.
+
+        Parameters:
+            value: The value to be serialized.
+
+        """
+        value_type = type(value)
+        hook = self.memo.get(value_type, MISSING)
+        if hook is MISSING:
+            hook = self.find(value_type)
+            if hook is None and self.__has_own_attrs(value):
+                hook = False
+            self.memo[value_type] = hook
+        if hook is False:
+            hook = self.find(value)
+        if hook is None:
+            return value
+        (post_process, method_name) = hook
+        ret = getattr(value, method_name)()
+        return post_process(ret) if post_process else ret
+
+
+def find_deserializer(cast, hooks):
+    """
+    Find the deserialization hook the cast has.
+
+    Parameters:
+        cast: The type to restore the value.
+        hooks: The tuple of (method name, pre-process function). For example,
+            (("from_json", json.dumps), ("from_dict", None)) means
+            "call cast.from_json with the value dumped by json.dumps, or
+            call cast.from_dict if cast doesn't have from_json."
+
+    Return Value:
+        The first hook the cast has, or None if the cast doesn't have any
+        of the hooks.
+
+    """
+    for (method_name, pre_process) in hooks:
+        if hasattr(cast, method_name):
+            return (method_name, pre_process)
+    return None
@@ -10,9 +10,37 @@ from functools import partial
 
 import six
 
-from .fields import FieldBase
-from .helper import reduce_with_index
-from .structures import ConDict
+from .backends import get_backend
+from .codegen import (
+    generate_json_writer, generate_loader, generate_reader,
+    generate_serializer
+)
+from .columns import (
+    cast_column, field_dtype, make_column, require_numpy, value_cast
+)
+from .fields import FieldBase, MapField
+from .helper import (
+    MISSING, HookDispatcher, find_deserializer, join_chunks,
+    reduce_with_index
+)
+from .parallel import map_parallel
+from .structures import ConDict, MappingProxyType
+from .trie import GeneratedObject, build_trie, node_types, write_values
+
+
+class FieldTable(col.namedtuple("FieldTable", ("names", "fields", "index"))):
+    """
+    The fields of the mapper class, including the inherited ones.
+
+    Attributes:
+        names: The tuple of the names of the fields. The fields of the base
+            classes come first.
+        fields: The tuple of the fields in the same order of names.
+        index: The dict of the name -> the position of the field.
+
+    """
+
+    __slots__ = ()
 
 
 class MetaMapper(type):
@@ -20,12 +48,60 @@ class MetaMapper(type):
 
     def __init__(self, name, bases, members):
         """Init."""
-        self._fields = {}
         for (key, value) in members.items():
             if isinstance(value, FieldBase):
-                self._fields[key] = value
+                value.__set_name__(self, key)
+                value.compile(getattr(self, "codegen", False) or None)
+        self._update_fields()
         super(MetaMapper, self).__init__(name, bases, members)
 
+    def __setattr__(self, attr, value):
+        """Set the attribute, and update the fields if a field is set."""
+        super(MetaMapper, self).__setattr__(attr, value)
+        if isinstance(value, FieldBase):
+            value.__set_name__(self, attr)
+            value.compile(getattr(self, "codegen", False) or None)
+        if isinstance(value, FieldBase) or \
+                attr in self._field_table.index:
+            self._update_fields()
+
+    def __delattr__(self, attr):
+        """Delete the attribute, and update the fields if needed."""
+        super(MetaMapper, self).__delattr__(attr)
+        if attr in self._field_table.index:
+            self._update_fields()
+
+    def _update_fields(self):
+        """
+        Collect the fields, and discard the compiled functions.
+
+        The fields are collected along MRO, so the fields of the base classes
+        are included unless they are overridden by non-field attributes.
+        _field_names maps each field to its name in this class, because the
+        same field can be bound to several mappers under different names.
+        This is called when the class is created or the fields of the class
+        or its base classes are changed, and the subclasses are updated as
+        well.
+        """
+        fields = col.OrderedDict()
+        for cls in reversed(self.__mro__):
+            for (key, value) in vars(cls).items():
+                fields.pop(key, None)
+                if isinstance(value, FieldBase):
+                    fields[key] = value
+        self._field_table = FieldTable(
+            tuple(fields), tuple(fields.values()),
+            dict([(key, index) for (index, key) in enumerate(fields)])
+        )
+        self._field_names = dict(
+            (value, key) for (key, value) in reversed(fields.items())
+        )
+        for value in fields.values():
+            value._add_owner(self)
+        self._cache = {}
+        for subclass in type.__subclasses__(self):
+            subclass._update_fields()
+
 
 class Mapper(six.with_metaclass(MetaMapper)):
     """
@@ -36,6 +112,20 @@ class Mapper(six.with_metaclass(MetaMapper)):
     Useful Attributes:
         asdict: Set True if you put value as dict. By default, this value is
             Falsy value that means "put value as attribute."
+        codegen: Set True to let the fields defined in the mapper generate
+            their getters and setters as Python source code. The generated
+            code is straight-line code like `return obj.address.street[1]`,
+            and it is registered to linecache so that tracebacks and
+            profilers can show it. By default, this value is False.
+        json_backend: The name of JSON backend registered in omm.backends,
+            or the tuple of the names in the order of preference, e.g.
+            ("orjson", "json"). The first registered one is used by the JSON
+            methods. By default, the value is "json", i.e. the standard
+            library.
+        prefetch_executor: concurrent.futures.Executor that loads the lazy
+            sources of ConDict concurrently before the values are read, e.g.
+            by to_dict. By default, the thread pool shared by ConDict is
+            used.
 
     Use of asdict:
         Suppose that there is a mapper like this:
@@ -67,6 +157,11 @@ class Mapper(six.with_metaclass(MetaMapper)):
         ```
     """
 
+    __dict_hooks__ = ((None, "to_dict"), )
+    __json_hooks__ = ((json.loads, "to_json"), (None, "to_dict"))
+    __dict_loaders__ = (("from_dict", None), )
+    __json_loaders__ = (("from_json", json.dumps), ("from_dict", None))
+
     def __init__(self, target=None, **kwargs):
         """
         Initialize the object.
@@ -83,13 +178,31 @@ class Mapper(six.with_metaclass(MetaMapper)):
         super(Mapper, self).__init__()
 
     def validate(self):
-        """Validate the model."""
+        """
+        Validate the model.
+
+        Because the result depends only on the class definition, the errors
+        are collected once per class and cached until the fields of the
+        class or their options, e.g. set_cast, are changed. Each instance gets
+        its own copy of the errors.
+        """
+        errors = self.__cached(
+            ("errors", bool(getattr(self, "$testing$", False))),
+            self.__collect_errors
+        )
+        self.__errors = dict([
+            (name, list(messages)) for (name, messages) in errors.items()
+        ])
+        return not bool(self.__errors)
+
+    def __collect_errors(self):
+        """Run the validation, and return the errors."""
         self.__errors = {}
         self.__list = partial(sorted, key=tuple(self.fields.items()).index) \
             if getattr(self, "$testing$", False) else tuple
         rest_fields = self.__validate_each_field()
         rest_fields = self.__validate_consistency(rest_fields)
-        return not bool(self.__errors)
+        return self.__errors
 
     def __validate_each_field(self):
         """Validate each field."""
@@ -226,6 +339,45 @@ class Mapper(six.with_metaclass(MetaMapper)):
         if isinstance(target, ConDict):
             self._target.assign(self)
 
+    def rebind(self, target):
+        """
+        Connect the object to the mapper without any checks.
+
+        This is the fast path of connect for the objects that are known not
+        to be ConDict.
+
+        Parameters:
+            target: The target object. This must not be ConDict.
+
+        Return Value:
+            The mapper itself.
+
+        """
+        self._target = target
+        return self
+
+    @classmethod
+    def cursor(cls, objects, check=True, **kwargs):
+        """
+        Iterate the objects with a single mapper.
+
+        The same mapper is re-connected to each object and yielded, so that
+        no mapper is created per object. Don't keep the yielded mapper after
+        the next one is requested; it is re-connected to the next object.
+
+        Parameters:
+            objects: The iterable of the objects to be connected.
+            check: Set False if the objects are known not to be ConDict.
+                In this case, the objects are connected with rebind.
+            **kwargs: Any attributes or meta-data of the mapper.
+
+        """
+        mapper = cls(**kwargs)
+        connect = mapper.connect if check else mapper.rebind
+        for obj in objects:
+            connect(obj)
+            yield mapper
+
     @staticmethod
     def __extend_exclusion(fld, exclude_type, ser_type):
         exclude = getattr(fld, "exclude", None)
@@ -240,69 +392,569 @@ class Mapper(six.with_metaclass(MetaMapper)):
         if isinstance(exclude, dict):
             if isinstance(exclude_method, dict) and \
                     exclude is not exclude_method:
-                exclude.update(exclude_method)
+                merged = dict(exclude)
+                merged.update(exclude_method)
+                exclude = merged
             exclude = exclude.get(exclude_type, False)
-        return exclude
+        return bool(exclude)
 
-    def __compose_dict(self, priority_list, exclude_type):
-        dct = {}
-        for (name, fld) in self.fields.items():
-            if self.__extend_exclusion(fld, exclude_type, "serialize"):
-                continue
-            try:
-                value = getattr(self, name)
-                found_ser_fn = False
-                for (loads, dumps) in priority_list:
-                    try:
-                        dct[name] = loads(getattr(value, dumps)()) if loads\
-                            else getattr(value, dumps)()
-                        found_ser_fn = True
-                        break
-                    except AttributeError:
-                        continue
-                if not found_ser_fn:
-                    dct[name] = value
-            except AttributeError:
-                pass
-        return dct
-
-    @classmethod
-    def __restore_dict(cls, dct, attr_call_list, exclude_type):
-        ret = cls()
-        for (name, value) in dct.items():
-            fld = cls._fields.get(name)
-            if fld:
-                if cls.__extend_exclusion(fld, exclude_type, "deserialize"):
-                    continue
-                try:
-                    set_cast = fld.set_cast
-                    found_desr_fn = False
-                    if isinstance(set_cast, list):
-                        set_cast = set_cast[-1]
-                    for (loads_attr, dumps_fn) in attr_call_list:
-                        try:
-                            setattr(
-                                ret, name, getattr(
-                                    set_cast, loads_attr
-                                )(
-                                    dumps_fn({name: value})
-                                    if dumps_fn else
-                                    {name: value}
-                                )
-                            )
-                            found_desr_fn = True
-                            break
-                        except AttributeError:
-                            continue
-                    if not found_desr_fn:
-                        raise AttributeError()
-                except AttributeError:
-                    setattr(ret, name, value)
+    @classmethod
+    def __cached(cls, key, build):
+        """
+        Return the compiled function.
+
+        The function is built once per key, and cached until the fields of
+        the class are changed.
+        """
+        try:
+            return cls._cache[key]
+        except KeyError:
+            pass
+        ret = cls._cache[key] = build()
         return ret
 
+    @classmethod
+    def __build_table(cls):
+        table = cls._field_table
+        fields = tuple(zip(table.names, table.fields))
+        plans = dict([
+            (index, fld.plan) for (index, (_, fld)) in enumerate(fields)
+            if isinstance(fld, MapField)
+        ])
+        trie = build_trie(sorted(plans.items()), cls)
+        return (
+            fields, table.index, plans, trie, dict([
+                (fields[index][1], node_types(trie, plan))
+                for (index, plan) in plans.items()
+            ])
+        )
+
+    @classmethod
+    def __table(cls):
+        """
+        Return the compiled field table.
+
+        The table is the tuple of (fields, index, plans, trie, types).
+        fields is the tuple of (name, field), index is the dict of name ->
+        position of the field, plans is the dict of position -> PathPlan of
+        MapField, trie is the prefix tree of the plans, and types is the
+        dict of MapField -> the object types along its target.
+        """
+        return cls.__cached(("table", ), cls.__build_table)
+
+    @classmethod
+    def _prefix_tree(cls):
+        """Return the prefix tree of the paths of the fields."""
+        return cls.__table()[3]
+
+    @classmethod
+    def __build_reader(cls, indexes):
+        (fields, _, _, trie, _) = cls.__table()
+        return generate_reader(trie, [
+            (name, getattr(fld, "get_cast", None)) for (name, fld) in fields
+        ], ("{}.read").format(cls.__name__), indexes)
+
+    def __read_field(self, name):
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            return MISSING
+
+    def __read(self, indexes=None):
+        """
+        Read the values of the fields.
+
+        Parameters:
+            indexes: The positions of the fields to read, e.g. the
+                projection of the exclusion. The values of the other fields
+                are MISSING, and they aren't looked up, so that the excluded
+                fields don't raise. By default, all the fields are read.
+
+        """
+        root = self.connected_object
+        if isinstance(root, ConDict):
+            names = self._field_table.names
+            if indexes is None:
+                indexes = range(len(names))
+            root.prefetch(
+                [names[index] for index in indexes],
+                getattr(self, "prefetch_executor", None)
+            )
+            values = [MISSING] * len(names)
+            for index in indexes:
+                values[index] = self.__read_field(names[index])
+            return tuple(values)
+        return self.__cached(
+            ("reader", indexes), partial(self.__build_reader, indexes)
+        )(self, root)
+
+    def values(self):
+        """
+        Return the values of the fields as a dict.
+
+        The values are read in one pass: the intermediate objects shared by
+        the targets of the fields are resolved only once. The fields that
+        can't be resolved are omitted.
+        """
+        return dict([
+            (name, value)
+            for (name, value) in zip(self._field_table.names, self.__read())
+            if value is not MISSING
+        ])
+
+    @classmethod
+    def __build_projection(cls, exclude_type, ser_type):
+        return tuple(
+            index for (index, (_, fld)) in enumerate(cls.__table()[0])
+            if not cls.__extend_exclusion(fld, exclude_type, ser_type)
+        )
+
+    @classmethod
+    def __projection(cls, exclude_type, ser_type):
+        """
+        Return the positions of the fields that are not excluded.
+
+        The projection is computed once per (exclude_type, ser_type), and
+        shared by the functions compiled for the different hooks. It is
+        discarded when the exclude options of the fields are assigned, but
+        not when their dicts are modified in place.
+
+        Parameters:
+            exclude_type: The type of the exclusion.
+            ser_type: "serialize" or "deserialize".
+
+        """
+        return cls.__cached(
+            ("projection", exclude_type, ser_type),
+            partial(cls.__build_projection, exclude_type, ser_type)
+        )
+
+    @classmethod
+    def __build_serializer(cls, exclude_type, hooks):
+        fields = cls.__table()[0]
+        return generate_serializer(
+            [
+                (index, fields[index][0])
+                for index in cls.__projection(exclude_type, "serialize")
+            ], cls.__cached(
+                ("dispatcher", hooks), partial(HookDispatcher, hooks)
+            ),
+            ("{}.serialize {}").format(cls.__name__, exclude_type)
+        )
+
+    @classmethod
+    def __serializer(cls, hooks, exclude_type):
+        return cls.__cached(
+            ("serializer", exclude_type, hooks),
+            partial(cls.__build_serializer, exclude_type, hooks)
+        )
+
+    def __compose_dict(self, hooks, exclude_type):
+        return self.__serializer(hooks, exclude_type)(
+            self.__read(self.__projection(exclude_type, "serialize"))
+        )
+
+    @classmethod
+    def __iter_compose(cls, objects, hooks, exclude_type):
+        """
+        Serialize the objects one by one with a single mapper.
+
+        The mapper is re-connected to each object like a cursor, so that
+        neither a mapper nor the compiled serializer is created per object.
+        """
+        serialize = cls.__serializer(hooks, exclude_type)
+        indexes = cls.__projection(exclude_type, "serialize")
+        for mapper in cls.cursor(objects):
+            yield serialize(mapper.__read(indexes))
+
+    @classmethod
+    def __build_json_writer(cls, hooks):
+        fields = cls.__table()[0]
+        return generate_json_writer(
+            [
+                (index, fields[index][0])
+                for index in cls.__projection("json", "serialize")
+            ], cls.__cached(
+                ("dispatcher", hooks), partial(HookDispatcher, hooks)
+            ), json.dumps, ("{}.write_json").format(cls.__name__)
+        )
+
+    @classmethod
+    def __json_writer(cls):
+        hooks = cls.__json_hooks__
+        return cls.__cached(
+            ("json_writer", hooks), partial(cls.__build_json_writer, hooks)
+        )
+
+    def __encode_json(self):
+        backend = self.__backend(self)
+        if backend.name != "json":
+            return backend.dumps(
+                self.__compose_dict(self.__json_hooks__, "json")
+            )
+        parts = []
+        self.__json_writer()(
+            self.__read(self.__projection("json", "serialize")), parts.append
+        )
+        return ("").join(parts)
+
+    @classmethod
+    def __iter_json_array(cls, objects):
+        """
+        Generate the fragments of JSON array of the objects.
+
+        If the JSON backend is the standard library, the objects are written
+        by the compiled writer. Otherwise, they are encoded by dumps of the
+        backend one by one, and separated by "," like the compact encoders,
+        e.g. orjson and ujson.
+        """
+        delimiter = ", " if cls.__backend(cls).name == "json" else ","
+        sep = "["
+        for mapper in cls.cursor(objects):
+            yield sep + mapper.__encode_json()
+            sep = delimiter
+        yield "[]" if sep == "[" else "]"
+
+    @classmethod
+    def __build_loader(cls, exclude_type, hooks):
+        fields = cls.__table()[0]
+        deserializers = cls.__cached(("deserializers", hooks), dict)
+        entries = []
+        for index in cls.__projection(exclude_type, "deserialize"):
+            (name, fld) = fields[index]
+            set_cast = getattr(fld, "set_cast", None)
+            if isinstance(set_cast, list):
+                set_cast = set_cast[-1]
+            direct = isinstance(fld, MapField)
+            try:
+                fld.validate()
+            except (AttributeError, ValueError):
+                direct = False
+            if set_cast not in deserializers:
+                deserializers[set_cast] = find_deserializer(set_cast, hooks)
+            entries.append((
+                index, name, set_cast, deserializers[set_cast], direct
+            ))
+        return generate_loader(
+            entries, ("{}.load {}").format(cls.__name__, exclude_type)
+        )
+
+    @classmethod
+    def __restore_dict(cls, dct, hooks, exclude_type):
+        return cls.__cached(
+            ("loader", exclude_type, hooks),
+            partial(cls.__build_loader, exclude_type, hooks)
+        )(cls(), dct, cls.__write)
+
+    def __write(self, values):
+        """
+        Write the values to the connected object at once.
+
+        Parameters:
+            values: The dict of field index -> value.
+
+        """
+        root = self.connected_object
+        (fields, _, plans, trie, _) = self.__table()
+        if isinstance(root, ConDict):
+            for (index, value) in values.items():
+                setattr(self, fields[index][0], value)
+            return
+        obj_type = dict if getattr(self, "asdict", False) else None
+        if root is None:
+            root = (
+                plans[next(iter(values))].root_cast or
+                obj_type or trie.obj_type
+            )()
+            self.connect(root)
+        write_values(trie, root, values, plans, obj_type)
+
+    def _object_types(self, field):
+        """
+        Return the types to create the objects along the target of the field.
+
+        The types are generated once per class from the prefix tree of the
+        fields, so that the fields sharing a path create the same compact
+        type. If asdict is set, all the types are dict.
+
+        Parameters:
+            field: MapField to resolve.
+
+        """
+        if getattr(self, "asdict", False):
+            return (dict, ) * field.plan.num_cast
+        try:
+            return self.__table()[4][field]
+        except KeyError:
+            return (GeneratedObject, ) * field.plan.num_cast
+
+    def update(self, mapping):
+        """
+        Put the values to the fields at once.
+
+        Unlike setting the fields one by one, the fields are validated before
+        anything is written, and the values are written in one traversal:
+        the intermediate objects shared by the targets are resolved or
+        created at most once. The keys that are not fields are set as the
+        attributes like the keyword arguments of the constructor.
+
+        Parameters:
+            mapping: The dict of field name -> value.
+
+        """
+        (fields, index, plans, _, _) = self.__table()
+        values = {}
+        attrs = []
+        for (name, value) in mapping.items():
+            if index.get(name) in plans:
+                values[index[name]] = value
+            else:
+                attrs.append((name, value))
+        for position in values:
+            fields[position][1].validate()
+        for (name, value) in attrs:
+            setattr(self, name, value)
+        if values:
+            self.__write(values)
+
     def to_dict(self, exclude_type="dict"):
         """Convert the schema into dict."""
-        return self.__compose_dict([(None, "to_dict")], exclude_type)
+        return self.__compose_dict(self.__dict_hooks__, exclude_type)
+
+    @classmethod
+    def iter_dicts(cls, objects, exclude_type="dict"):
+        """
+        Convert the objects into dicts lazily.
+
+        Parameters:
+            objects: The iterable of the objects to be connected to the
+                mapper.
+            exclude_type: The type of exclusion.
+
+        Return Value:
+            The generator of the dicts. Each dict is the same as the result
+            of to_dict of the mapper connected to the object.
+
+        """
+        return cls.__iter_compose(objects, cls.__dict_hooks__, exclude_type)
+
+    @classmethod
+    def to_dicts(cls, objects, exclude_type="dict"):
+        """
+        Convert the objects into the list of dicts.
+
+        Parameters:
+            objects: The iterable of the objects to be connected to the
+                mapper.
+            exclude_type: The type of exclusion.
+
+        """
+        return list(cls.iter_dicts(objects, exclude_type))
+
+    @classmethod
+    def map_parallel(
+        cls, iterable, workers=None, chunksize=1024, ordered=True,
+        method="to_dict", exclude_type="dict"
+    ):
+        """
+        Convert the objects or the dicts on the process pool.
+
+        The iterable is split into the chunks, and each chunk is converted
+        by to_dicts or from_dict in a worker process. The mapper class is
+        sent to the workers by its name, and each worker builds the compiled
+        plans once and reuses them for the chunks.
+
+        Parameters:
+            iterable: The iterable of the objects to be serialized, or the
+                dicts to be deserialized. They must be picklable.
+            workers: The number of the worker processes. By default, the
+                number of the processors.
+            chunksize: The number of the values sent to a worker at once.
+            ordered: Set False to get the results of the chunks in the
+                order they are completed instead of the order of the
+                iterable.
+            method: "to_dict" to serialize the objects, or "from_dict" to
+                deserialize the dicts into the mappers.
+            exclude_type: The type of exclusion.
+
+        Return Value:
+            The generator of the dicts or the mappers. The mapper class must
+            be defined at module level so that the workers can import it.
+
+        """
+        return map_parallel(
+            cls, iterable, method, exclude_type, workers, chunksize, ordered
+        )
+
+    @classmethod
+    def to_columns(cls, objects, exclude_type="dict"):
+        """
+        Convert the objects into the columns of the fields.
+
+        The values of the fields are read with a single mapper, and appended
+        to one list per field as they are read. The values are the same as
+        the values of to_dict.
+
+        Parameters:
+            objects: The iterable of the objects to be connected to the
+                mapper.
+            exclude_type: The type of exclusion.
+
+        Return Value:
+            OrderedDict of the field name -> the column. If the type of the
+            values read from the field, i.e. get_cast, or the last type of
+            set_cast if the field doesn't have get_cast, is float or int,
+            the column is NumPy array when NumPy is installed, or
+            array.array otherwise. The other columns are lists. See
+            columns.make_column for details.
+
+        """
+        fields = cls.__table()[0]
+        indexes = cls.__projection(exclude_type, "serialize")
+        serialize = cls.__cached(
+            ("dispatcher", cls.__dict_hooks__),
+            partial(HookDispatcher, cls.__dict_hooks__)
+        )
+        columns = []
+        for index in indexes:
+            value_type = value_cast(fields[index][1])
+            columns.append((index, value_type, None if value_type in (
+                float, int
+            ) else serialize, []))
+        for mapper in cls.cursor(objects):
+            values = mapper.__read(indexes)
+            for (index, _, convert, column) in columns:
+                value = values[index]
+                column.append(
+                    value if convert is None or value is MISSING
+                    else convert(value)
+                )
+        return col.OrderedDict([
+            (fields[index][0], make_column(column, cast))
+            for (index, cast, _, column) in columns
+        ])
+
+    @classmethod
+    def from_columns(cls, columns, exclude_type="dict", asdict=None):
+        """
+        Build the objects from the columns of the fields.
+
+        This is the reverse of to_columns. The columns are casted into the
+        types of set_cast at once per column when this method is called, and
+        then the objects are built row by row with the compiled plans.
+
+        Parameters:
+            columns: The dict of the field name -> the column. The column
+                can be a list, array.array, or NumPy array, and all the
+                columns must have the same length. None or NaN in a column
+                means the value is missing, like the columns of to_columns.
+                The unknown names are ignored.
+            exclude_type: The type of exclusion.
+            asdict: Set True to build dicts, or False to build objects. By
+                default, asdict of the class is used.
+
+        Return Value:
+            The iterator of the built objects, i.e. the objects that would
+            be connected to the mapper.
+
+        """
+        (fields, index, plans, _, _) = cls.__table()
+        accepted = set(cls.__projection(exclude_type, "deserialize"))
+        (indexes, data) = ([], [])
+        for (name, column) in columns.items():
+            position = index.get(name)
+            if position not in plans or position not in accepted:
+                continue
+            fields[position][1].validate()
+            indexes.append(position)
+            data.append(cls.__cast_column(name, column, plans[position]))
+        if len(set(len(values) for values in data)) > 1:
+            raise ValueError("All the columns must have the same length.")
+        return cls.__iter_rows(indexes, data, asdict)
+
+    @classmethod
+    def __cast_column(cls, name, column, plan):
+        cast = plan.steps[-1].cast
+        hook = cast and find_deserializer(cast, cls.__dict_loaders__)
+        if not hook:
+            return cast_column(column, cast)
+        restore = getattr(cast, hook[0])
+        return [
+            value if value is None else restore({name: value})
+            for value in cast_column(column)
+        ]
+
+    @classmethod
+    def __iter_rows(cls, indexes, data, asdict):
+        (_, _, plans, trie, _) = cls.__table()
+        if asdict is None:
+            asdict = getattr(cls, "asdict", False)
+        obj_type = dict if asdict else None
+        root_type = ([
+            plans[position].root_cast for position in indexes
+            if plans[position].root_cast
+        ] + [obj_type or trie.obj_type])[0]
+        for row in zip(*data):
+            root = root_type()
+            write_values(trie, root, dict([
+                (position, value)
+                for (position, value) in zip(indexes, row)
+                if value is not None
+            ]), plans, obj_type)
+            yield root
+
+    @classmethod
+    def to_structured_array(cls, objects, exclude_type="dict"):
+        """
+        Convert the objects into NumPy structured array.
+
+        The dtype is derived from the fields (see columns.field_dtype), and
+        the array is filled column by column from the result of to_columns.
+        The missing float values are NaN, and the other fields shouldn't have
+        missing values. This method requires NumPy.
+
+        Parameters:
+            objects: The iterable of the objects to be connected to the
+                mapper.
+            exclude_type: The type of exclusion.
+
+        """
+        np = require_numpy()
+        fields = cls.__table()[0]
+        dtype = np.dtype([
+            (fields[index][0], field_dtype(fields[index][1]))
+            for index in cls.__projection(exclude_type, "serialize")
+        ])
+        cols = cls.to_columns(objects, exclude_type)
+        ret = np.empty(
+            len(next(iter(cols.values()))) if cols else 0, dtype=dtype
+        )
+        for (name, column) in cols.items():
+            ret[name] = column
+        return ret
+
+    @classmethod
+    def from_structured_array(cls, arr, exclude_type="dict", asdict=None):
+        """
+        Build the objects from NumPy structured array.
+
+        The fields of the array are passed to from_columns as the views of
+        the array, i.e. the columns are not copied before they are casted.
+
+        Parameters:
+            arr: The structured array whose field names are the names of the
+                fields of the mapper.
+            exclude_type: The type of exclusion.
+            asdict: Set True to build dicts, or False to build objects. By
+                default, asdict of the class is used.
+
+        Return Value:
+            The iterator of the built objects.
+
+        """
+        return cls.from_columns(col.OrderedDict([
+            (name, arr[name]) for name in arr.dtype.names
+        ]), exclude_type, asdict)
 
     @classmethod
     def from_dict(cls, dct, exclude_type="dict"):
@@ -313,7 +965,7 @@ class Mapper(six.with_metaclass(MetaMapper)):
             dct: The dict to be deserialize.
 
         """
-        return cls.__restore_dict(dct, [("from_dict", None)], exclude_type)
+        return cls.__restore_dict(dct, cls.__dict_loaders__, exclude_type)
 
     def dumps(self, ser_fn, exclude_type="custom"):
         """
@@ -331,17 +983,162 @@ class Mapper(six.with_metaclass(MetaMapper)):
         """Deserialize the map with specified function."""
         return self.from_dict(desr_fn(data), exclude_type)
 
+    @staticmethod
+    def __backend(obj):
+        return get_backend(getattr(obj, "json_backend", "json"))
+
     def to_json(self, **kwargs):
         """
         Generate JSON string.
 
         Parameters:
-            **kwargs: Any keyword arguemnt to be passed to json.dumps
+            **kwargs: Any keyword arguemnt to be passed to dumps of the JSON
+                backend, e.g. json.dumps
+
+        """
+        return self.__backend(self).dumps(
+            self.__compose_dict(self.__json_hooks__, "json"), **kwargs
+        )
+
+    def to_json_bytes(self, **kwargs):
+        """
+        Generate JSON as UTF-8 bytes.
+
+        If the JSON backend encodes into bytes natively, the result is
+        returned without being converted from str.
+
+        Parameters:
+            **kwargs: Any keyword arguemnt to be passed to dumps_bytes of the
+                JSON backend.
+
+        """
+        return self.__backend(self).dumps_bytes(
+            self.__compose_dict(self.__json_hooks__, "json"), **kwargs
+        )
+
+    @classmethod
+    def to_json_array(cls, objects, **kwargs):
+        """
+        Generate JSON array string from the objects.
+
+        Parameters:
+            objects: The iterable of the objects to be connected to the
+                mapper.
+            **kwargs: Any keyword arguemnt to be passed to dumps of the JSON
+                backend, e.g. json.dumps
+
+        """
+        backend = cls.__backend(cls)
+        if not kwargs and backend.name == "json":
+            return ("").join(cls.__iter_json_array(objects))
+        return backend.dumps(list(cls.__iter_compose(
+            objects, cls.__json_hooks__, "json"
+        )), **kwargs)
+
+    @classmethod
+    def iter_json_array(cls, objects, chunk_size=65536):
+        """
+        Generate JSON array string from the objects as chunks.
+
+        The objects are serialized one by one, and their keys and values are
+        written as JSON fragments directly, i.e. neither the dicts of the
+        objects nor the whole array is built. The result is the same as
+        to_json_array without keyword arguments. If the JSON backend isn't
+        the standard library, each object is encoded by dumps of the backend
+        and the objects are separated by ",", which is the same as
+        to_json_array for the compact encoders, e.g. orjson and ujson.
+
+        Parameters:
+            objects: The iterable of the objects to be connected to the
+                mapper.
+            chunk_size: The minimum length of each chunk except the last one.
+
+        Return Value:
+            The generator of the str chunks, e.g. for streaming responses.
 
         """
-        return json.dumps(self.__compose_dict([
-            (json.loads, "to_json"), (None, "to_dict")
-        ], "json"))
+        return join_chunks(cls.__iter_json_array(objects), chunk_size)
+
+    @classmethod
+    def write_json_array(cls, objects, fp, chunk_size=65536):
+        """
+        Write JSON array of the objects to the stream.
+
+        The chunks generated by iter_json_array are written, and the stream
+        is flushed after each chunk if it can be flushed.
+
+        Parameters:
+            objects: The iterable of the objects to be connected to the
+                mapper.
+            fp: The file-like object opened in text mode.
+            chunk_size: The minimum length of each chunk except the last one.
+
+        """
+        flush = getattr(fp, "flush", None)
+        for chunk in cls.iter_json_array(objects, chunk_size):
+            fp.write(chunk)
+            if flush:
+                flush()
+
+    @classmethod
+    def iter_jsonl(cls, objects, fp, **kwargs):
+        """
+        Write the objects to the file as JSON Lines.
+
+        The objects are serialized and written one by one, so that the whole
+        data is never held in memory. Each line is the same as the result of
+        to_json of the mapper connected to the object.
+
+        Parameters:
+            objects: The iterable of the objects to be connected to the
+                mapper.
+            fp: The file-like object opened in text mode, e.g. the file
+                returned by open(path, "w") or socket.makefile("w").
+            **kwargs: Any keyword arguemnt to be passed to dumps of the JSON
+                backend. Note that indent shouldn't be specified because each
+                record must be in a line.
+
+        Return Value:
+            The number of the written records.
+
+        """
+        dumps = cls.__backend(cls).dumps
+        count = 0
+        for dct in cls.__iter_compose(objects, cls.__json_hooks__, "json"):
+            fp.write(dumps(dct, **kwargs) + "\n")
+            count += 1
+        return count
+
+    @classmethod
+    def read_jsonl(cls, fp, **kwargs):
+        """
+        Read the mappers from JSON Lines lazily.
+
+        Parameters:
+            fp: The iterable of the lines, e.g. the file-like object.
+            **kwargs: Any keyword arguments to be passed to from_json
+
+        Return Value:
+            The generator of the mappers. The blank lines are skipped.
+
+        """
+        for line in fp:
+            if line.strip():
+                yield cls.from_json(line, **kwargs)
+
+    def write_json(self, fp):
+        """
+        Write JSON object to the stream.
+
+        The result is the same as to_json without keyword arguments. If the
+        JSON backend is the standard library, the object is written without
+        building the dict.
+
+        Parameters:
+            fp: The file-like object opened in text mode.
+
+        """
+        fp.write(self.__encode_json())
 
     @classmethod
     def from_json(cls, json_str, **kwargs):
@@ -349,20 +1146,39 @@ class Mapper(six.with_metaclass(MetaMapper)):
         De-serialize JSON string into the object.
 
         Parameters:
-            json_str: JSON string to be deserialized
-            **kwargs: Any keyword arguments to be passed to json.loads
+            json_str: JSON string or UTF-8 bytes to be deserialized
+            **kwargs: Any keyword arguments to be passed to loads of the JSON
+                backend, e.g. json.loads
 
         """
+        backend = cls.__backend(cls)
+        if backend.name == "json" and \
+                isinstance(json_str, six.binary_type):
+            json_str = json_str.decode("utf-8")
         return cls.__restore_dict(
-            json.loads(json_str, **kwargs),
-            [("from_json", json.dumps), ("from_dict", None)],
+            backend.loads(json_str, **kwargs),
+            cls.__json_loaders__,
             "json"
         )
 
-    @property
-    def fields(self):
-        """Return fields."""
+    def __build_fields(self):
         (FieldList, FieldDict) = (
             partial(sorted, key=lambda cmp: cmp[0]), col.OrderedDict
         ) if getattr(self, "$testing$", False) else (list, dict)
-        return FieldDict(FieldList(self._fields.items()))
+        table = self._field_table
+        return MappingProxyType(
+            FieldDict(FieldList(zip(table.names, table.fields)))
+        )
+
+    @property
+    def fields(self):
+        """
+        Return the read-only mapping of the name -> the field.
+
+        The mapping is built once per class, and cached until the fields of
+        the class are changed.
+        """
+        return self.__cached(
+            ("fields", bool(getattr(self, "$testing$", False))),
+            self.__build_fields
+        )
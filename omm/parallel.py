@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Parallel bulk conversion."""
+
+from collections import deque
+from itertools import islice
+from multiprocessing import cpu_count
+
+try:
+    from concurrent.futures import (
+        FIRST_COMPLETED, ProcessPoolExecutor, wait
+    )
+except ImportError:
+    ProcessPoolExecutor = None
+
+_methods = ("to_dict", "from_dict")
+
+
+def iter_chunks(iterable, size):
+    """
+    Split the iterable into the lists.
+
+    Parameters:
+        iterable: The iterable to be split.
+        size: The maximum length of each list.
+
+    """
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def convert_chunk(mapper, method, exclude_type, chunk):
+    """
+    Convert the chunk in the worker.
+
+    The mapper class is pickled by its name, and its compiled plans are
+    cached on the class in the worker process, so that they are built once
+    per worker rather than once per chunk.
+
+    Parameters:
+        mapper: The mapper class.
+        method: "to_dict" or "from_dict".
+        exclude_type: The type of exclusion.
+        chunk: The list of the objects or the dicts.
+
+    Return Value:
+        The list of the converted values.
+
+    """
+    if method == "to_dict":
+        return mapper.to_dicts(chunk, exclude_type)
+    return [mapper.from_dict(dct, exclude_type) for dct in chunk]
+
+
+def _drain(pending, ordered):
+    if ordered:
+        return [pending.popleft().result()]
+    (done, _) = wait(pending, return_when=FIRST_COMPLETED)
+    for future in done:
+        pending.remove(future)
+    return [future.result() for future in done]
+
+
+def _flush(pending, ordered, limit):
+    while len(pending) > limit:
+        for result in _drain(pending, ordered):
+            for value in result:
+                yield value
+
+
+def _iter_parallel(mapper, iterable, method, exclude_type, workers,
+                   chunksize, ordered):
+    pending = deque() if ordered else set()
+    add = pending.append if ordered else pending.add
+    with ProcessPoolExecutor(workers) as executor:
+        try:
+            for chunk in iter_chunks(iterable, chunksize):
+                add(executor.submit(
+                    convert_chunk, mapper, method, exclude_type, chunk
+                ))
+                for value in _flush(pending, ordered, 2 * workers - 1):
+                    yield value
+            for value in _flush(pending, ordered, 0):
+                yield value
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def map_parallel(
+    mapper, iterable, method, exclude_type, workers, chunksize, ordered
+):
+    """
+    Convert the iterable on the process pool.
+
+    At most twice as many chunks as the workers are submitted at a time,
+    so that the iterable is consumed as the results are yielded.
+
+    Parameters:
+        mapper: The mapper class. This must be importable by its name.
+        iterable: The iterable of the objects or the dicts.
+        method: "to_dict" or "from_dict".
+        exclude_type: The type of exclusion.
+        workers: The number of the worker processes. None means the number
+            of the processors.
+        chunksize: The number of the values sent to a worker at once.
+        ordered: Set False to yield the results of the chunks in the order
+            they are completed.
+
+    Return Value:
+        The generator of the converted values.
+
+    """
+    if ProcessPoolExecutor is None:
+        raise ImportError(
+            "concurrent.futures is required to convert in parallel."
+        )
+    if method not in _methods:
+        raise ValueError(("method must be one of {}, not {}").format(
+            (", ").join(_methods), method
+        ))
+    return _iter_parallel(
+        mapper, iterable, method, exclude_type, workers or cpu_count(),
+        chunksize, ordered
+    )
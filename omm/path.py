@@ -0,0 +1,233 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compiled path plans for MapField targets."""
+
+import re
+from collections import namedtuple
+
+from .helper import extend_list
+
+_index_find_pattern = re.compile(r"\[([0-9]+)\]")
+
+
+class PathSegment(namedtuple("PathSegment", ("name", "indexes"))):
+    """
+    A dot-separated element of the target.
+
+    Attributes:
+        name: The name of the attribute / key.
+        indexes: The tuple of the list indexes that follow the name.
+
+    """
+
+    __slots__ = ()
+
+
+class PathStep(namedtuple("PathStep", ("key", "is_index", "cast"))):
+    """
+    A single traversal step of the target.
+
+    Attributes:
+        key: The attribute name / dict key, or the list index when is_index is
+            True.
+        is_index: True if the step indexes a list, False if the step looks up
+            an attribute or a dict key.
+        cast: The type of the value this step points to. None if the type is
+            not specified.
+
+    """
+
+    __slots__ = ()
+
+
+class PathPlan(namedtuple(
+    "PathPlan", ("target", "root_cast", "segments", "steps", "num_cast")
+)):
+    """
+    The immutable, parsed form of MapField target.
+
+    Attributes:
+        target: The original target string.
+        root_cast: The type of the root object. None if not specified.
+        segments: The tuple of PathSegment.
+        steps: The tuple of PathStep, i.e. the flattened segments.
+        num_cast: The number of the types set_cast should have if it is a list.
+
+    """
+
+    __slots__ = ()
+
+
+def compile_path(target, sep_char=".", set_cast=None):
+    """
+    Compile the target into PathPlan.
+
+    Parameters:
+        target: The dot-notated target.
+        sep_char: Seperation character.
+        set_cast: set_cast of the field. Can be a list, a type or None.
+
+    """
+    segments = tuple(
+        PathSegment(
+            _index_find_pattern.sub("", attr),
+            tuple(
+                int(index) for index in _index_find_pattern.findall(attr)
+            )
+        ) for attr in target.split(sep_char)
+    )
+    keys = [
+        (key, is_index) for segment in segments
+        for (key, is_index) in [(segment.name, False)] + [
+            (index, True) for index in segment.indexes
+        ]
+    ]
+    casts = [None] * (len(keys) + 1)
+    if isinstance(set_cast, list):
+        casts[:len(set_cast)] = set_cast[:len(casts)]
+    elif set_cast is not None:
+        casts[-1] = set_cast
+    return PathPlan(
+        target, casts[0], segments,
+        tuple(
+            PathStep(key, is_index, cast)
+            for ((key, is_index), cast) in zip(keys, casts[1:])
+        ), len(keys) + 1
+    )
+
+
+def lookup(data, step):
+    """
+    Resolve a step.
+
+    Parameters:
+        data: The object, dict or list to look up.
+        step: PathStep to resolve.
+
+    """
+    if step.is_index or isinstance(data, dict):
+        return data[step.key]
+    return getattr(data, step.key)
+
+
+def get_value(plan, data):
+    """
+    Get the value the plan points to.
+
+    Parameters:
+        plan: PathPlan to resolve.
+        data: The root object.
+
+    """
+    for step in plan.steps:
+        data = lookup(data, step)
+    return data
+
+
+def _get_existing(container, step, next_step):
+    if step.is_index:
+        extend_list(container, step.key)
+        child = container[step.key]
+        return child if isinstance(child, list) or not (
+            next_step.is_index or child is None
+        ) else None
+    try:
+        return lookup(container, step)
+    except (AttributeError, KeyError):
+        return None
+
+
+def create(container, step, next_step, obj_type):
+    """
+    Create the child the step points to, and put it to the container.
+
+    Parameters:
+        container: The parent object, dict or list.
+        step: PathStep that points to the child.
+        next_step: PathStep that follows the step.
+        obj_type: The type used when the child should be an object, but the
+            cast is not specified.
+
+    """
+    if isinstance(container, dict) and not step.is_index:
+        obj_type = dict
+    cast = step.cast or obj_type
+    child = [] if next_step.is_index and not issubclass(cast, list) \
+        else cast()
+    assign(container, step, child)
+    return child
+
+
+def get_or_create(container, step, next_step, obj_type):
+    """
+    Get the child the step points to, or create it if it doesn't exist.
+
+    Parameters:
+        container: The parent object, dict or list.
+        step: PathStep that points to the child.
+        next_step: PathStep that follows the step.
+        obj_type: The type used when the child should be an object, but the
+            cast is not specified.
+
+    """
+    child = _get_existing(container, step, next_step)
+    if child is not None:
+        return child
+    return create(container, step, next_step, obj_type)
+
+
+def assign(container, step, value):
+    """
+    Put the value to the container as the step describes.
+
+    Parameters:
+        container: The parent object, dict or list.
+        step: PathStep that points to the value.
+        value: The value to put.
+
+    """
+    if step.is_index:
+        extend_list(container, step.key)
+        container[step.key] = value
+    elif isinstance(container, dict):
+        container[step.key] = value
+    else:
+        setattr(container, step.key, value)
+
+
+def cast_value(step, value):
+    """
+    Cast the value into the type of the step.
+
+    Parameters:
+        step: PathStep that has the type to cast.
+        value: The value to be casted.
+
+    """
+    if step.cast is None or type(value) is step.cast:
+        return value
+    return step.cast(value)
+
+
+def set_value(plan, root, value, obj_types):
+    """
+    Put the value to the position the plan points to.
+
+    The intermediate objects are created if they don't exist.
+
+    Parameters:
+        plan: PathPlan to resolve.
+        root: The root object.
+        value: The value to put.
+        obj_types: The sequence of the types used when an intermediate
+            object should be created, but the cast is not specified.
+            (n + 1)-th type is used for the object the n-th step points to.
+
+    """
+    steps = plan.steps
+    for (index, step) in enumerate(steps[:-1]):
+        root = get_or_create(
+            root, step, steps[index + 1], obj_types[index + 1]
+        )
+    assign(root, steps[-1], cast_value(steps[-1], value))
@@ -3,13 +3,134 @@
 
 """Data structures."""
 
+from multiprocessing import cpu_count
+from threading import Lock
+
 from .fields import MapField
+from .helper import MISSING
 
 from six.moves import UserDict
 
+try:
+    from concurrent.futures import Future, ThreadPoolExecutor
+except ImportError:
+    Future = ThreadPoolExecutor = None
+
+try:
+    from types import MappingProxyType
+except ImportError:
+    from collections import Mapping
+
+    class MappingProxyType(Mapping):
+        """Read-only view of the mapping for the Pythons without it."""
+
+        def __init__(self, mapping):
+            """
+            Init the view.
+
+            Parameters:
+                mapping: The mapping to be wrapped.
+
+            """
+            self.__mapping = mapping
+
+        def __getitem__(self, key):
+            """Get item."""
+            return self.__mapping[key]
+
+        def __iter__(self):
+            """Return iterable."""
+            return iter(self.__mapping)
+
+        def __len__(self):
+            """Return the number of the items."""
+            return len(self.__mapping)
+
+
+class Lazy(object):
+    """
+    The source of ConDict that is loaded on first access.
+
+    Attributes:
+        loader: The callable that takes no arguments and returns the source.
+
+    """
+
+    __slots__ = ("loader", )
+
+    def __init__(self, loader):
+        """
+        Init the source.
+
+        Parameters:
+            loader: The callable that returns the source.
+
+        """
+        self.loader = loader
+
+    def __call__(self):
+        """Load the source."""
+        return self.loader()
+
+
+_executor = []
+_executor_lock = Lock()
+
+
+def default_executor():
+    """
+    Return the thread pool shared by ConDict.prefetch.
+
+    The pool is created on the first call. None if concurrent.futures is not
+    available.
+    """
+    if ThreadPoolExecutor is None:
+        return None
+    with _executor_lock:
+        if not _executor:
+            _executor.append(ThreadPoolExecutor(cpu_count() * 5))
+    return _executor[0]
+
+
+def is_lazy(value):
+    """Check whether the value is Lazy or Future."""
+    return isinstance(value, Lazy) or (
+        Future is not None and isinstance(value, Future)
+    )
+
+
+class MissingSource(KeyError):
+    """
+    The error a loader raises when the source doesn't exist.
+
+    ConDict stores the source as missing instead of retrying the loader, and
+    the fields of the source are treated as unresolved. The other errors of
+    the loaders, including KeyError, are propagated.
+    """
+
+    pass
+
+
+def _resolve(value):
+    try:
+        return value() if isinstance(value, Lazy) else value.result()
+    except MissingSource:
+        return MISSING
+
+
+def _submit(executor, value):
+    return executor.submit(value.loader) if isinstance(value, Lazy) else value
+
 
 class ConDict(UserDict):
-    """Connection Dict for omm."""
+    """
+    Connection Dict for omm.
+
+    The values can be Lazy or concurrent.futures.Future. They are resolved
+    on first access, and replaced with the results. If the loader raises
+    MissingSource, the source is stored as missing, and accessing it raises
+    KeyError.
+    """
 
     def assign(self, model):
         """
@@ -32,11 +153,11 @@ class ConDict(UserDict):
 
     def __get_key(self, name):
         """Get key."""
-        key = name
-        if isinstance(key, MapField):
-            index = list(self.model.fields.values()).index(key)
-            key = list(self.model.fields.keys())[index]
-        return key
+        if not isinstance(name, MapField):
+            return name
+        model = getattr(self, "_ConDict__model", None)
+        return type(model)._field_names.get(name, name.name) \
+            if model is not None else name.name
 
     def __iter__(self):
         """Return iterable."""
@@ -44,8 +165,66 @@ class ConDict(UserDict):
 
     def __getitem__(self, name):
         """Get Item."""
-        return self.data[self.__get_key(name)]
+        key = self.__get_key(name)
+        value = self.data[key]
+        if is_lazy(value):
+            value = self.data[key] = _resolve(value)
+        if value is MISSING:
+            raise KeyError(key)
+        return value
+
+    def _pending(self, keys=None, check=is_lazy):
+        """
+        Return the sources to be resolved.
+
+        Parameters:
+            keys: The names or the fields to be checked. By default, all the
+                keys are checked.
+            check: The function that checks whether the value is pending.
+
+        Return Value:
+            The list of (key, value) of the pending values.
+
+        """
+        if keys is not None:
+            keys = set(self.__get_key(key) for key in keys)
+        return [
+            (key, value) for (key, value) in self.data.items()
+            if check(value) and (keys is None or key in keys)
+        ]
+
+    def prefetch(self, keys=None, executor=None):
+        """
+        Resolve the lazy sources concurrently.
+
+        The loaders of Lazy are submitted to the executor at once, and then
+        the results are collected with the ones of Future, so that the
+        latency is the longest load rather than the sum of them. The sources
+        whose loaders raise MissingSource are stored as missing.
+
+        Parameters:
+            keys: The keys to be resolved. By default, all the keys.
+            executor: concurrent.futures.Executor to run the loaders. By
+                default, the thread pool returned by default_executor is
+                used. If only one loader is pending, it is called directly.
+
+        """
+        pending = self._pending(keys)
+        if sum(isinstance(value, Lazy) for (_, value) in pending) > 1:
+            executor = executor or default_executor()
+            if executor is not None:
+                pending = [
+                    (key, _submit(executor, value))
+                    for (key, value) in pending
+                ]
+        for (key, value) in pending:
+            self.data[key] = _resolve(value)
 
     def __contains__(self, item):
-        """Check if item exists."""
-        return self.__get_key(item) in self.data
+        """
+        Check if item exists.
+
+        The sources stored as missing don't exist. Note that the lazy
+        sources aren't resolved to check this.
+        """
+        return self.data.get(self.__get_key(item), MISSING) is not MISSING
@@ -0,0 +1,201 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Prefix tree of the compiled paths."""
+
+from collections import OrderedDict
+
+from .codegen import is_identifier
+from .path import assign, cast_value, get_or_create
+
+
+class GeneratedObject(object):
+    """
+    The base type of the intermediate objects created by the mappers.
+
+    Each node of the prefix tree has its own subclass whose __slots__ are
+    the attributes the fields put under the node. The other attributes can
+    still be set because this base class has __dict__, which is allocated
+    only when such an attribute is set.
+
+    The subclasses are created at runtime, so they can't be pickled by
+    their names. Instead, the objects are pickled with the mapper class that
+    owns the subclass and the keys of the node, and the subclass is looked
+    up again from the prefix tree of the mapper when they are unpickled.
+    """
+
+    def __reduce_ex__(self, protocol):
+        """Return the pickling information of the object."""
+        reduced = super(GeneratedObject, self).__reduce_ex__(
+            max(protocol, 2)
+        )
+        owner = type(self).__dict__.get("__owner__")
+        if owner is None or owner[0] is None:
+            return reduced
+        return (restore_object, owner) + tuple(reduced[2:])
+
+
+def restore_object(owner, keys):
+    """
+    Create the empty object of the node (used by pickle).
+
+    Parameters:
+        owner: The mapper class that owns the prefix tree.
+        keys: The tuple of the keys of the children from the root to the
+            node.
+
+    """
+    node = owner._prefix_tree()
+    for key in keys:
+        node = node.children[key]
+    return GeneratedObject.__new__(node.obj_type)
+
+
+class TrieNode(object):
+    """
+    A node of the prefix tree.
+
+    Attributes:
+        step: PathStep that points to this node from its parent. None if
+            the node is the root.
+        children: OrderedDict of (key, is_index) of PathStep -> TrieNode.
+        fields: The list of the indexes of the fields that point to this
+            node.
+        descendants: The frozenset of the indexes of the fields that point
+            to this node or its descendants.
+        obj_type: The subclass of GeneratedObject that is used when the
+            object of this node should be created, but the cast is not
+            specified. None if the node doesn't have any children.
+
+    """
+
+    __slots__ = ("step", "children", "fields", "descendants", "obj_type")
+
+    def __init__(self, step=None):
+        """
+        Init the node.
+
+        Parameters:
+            step: PathStep that points to this node.
+
+        """
+        self.step = step
+        self.children = OrderedDict()
+        self.fields = []
+        self.descendants = frozenset()
+        self.obj_type = None
+
+    def walk(self):
+        """Iterate the node and its descendants in pre-order."""
+        yield self
+        for child in self.children.values():
+            for node in child.walk():
+                yield node
+
+
+def _assign_types(node, owner, keys):
+    if node.children:
+        node.obj_type = type("GeneratedObject", (GeneratedObject, ), {
+            "__slots__": tuple(sorted(set(
+                key for (key, is_index) in node.children
+                if not is_index and is_identifier(key) and
+                not key.startswith("__")
+            ))),
+            "__owner__": (owner, keys)
+        })
+    for (key, child) in node.children.items():
+        _assign_types(child, owner, keys + (key, ))
+
+
+def build_trie(plans, owner=None):
+    """
+    Build the prefix tree of the plans.
+
+    The steps that have the same key and kind share the same node
+    even if their casts are different. After the tree is built, the nodes
+    that have children get their own object type.
+
+    Parameters:
+        plans: The iterable of (field index, PathPlan).
+        owner: The mapper class the tree is built for. If this is specified,
+            the objects of the types can be pickled.
+
+    """
+    root = TrieNode()
+    for (index, plan) in plans:
+        route = [root]
+        for step in plan.steps:
+            route.append(route[-1].children.setdefault(
+                (step.key, step.is_index), TrieNode(step)
+            ))
+        route[-1].fields.append(index)
+        for node in route:
+            node.descendants |= frozenset([index])
+    _assign_types(root, owner, ())
+    return root
+
+
+def node_types(trie, plan):
+    """
+    Return the object types along the plan.
+
+    Parameters:
+        trie: TrieNode built from the plans including the plan.
+        plan: PathPlan to resolve.
+
+    Return Value:
+        The tuple of the types. The first element is the type of the root,
+        and the (n + 1)-th element is the type of the object the n-th step
+        points to.
+
+    """
+    route = [trie]
+    for step in plan.steps:
+        route.append(route[-1].children[(step.key, step.is_index)])
+    return tuple(node.obj_type for node in route)
+
+
+def _next_step(node, keys):
+    for child in node.children.values():
+        if not child.descendants.isdisjoint(keys):
+            return child.step
+    return None
+
+
+def _write(node, container, values, keys, plans, obj_type):
+    for child in node.children.values():
+        if child.descendants.isdisjoint(keys):
+            continue
+        for index in child.fields:
+            if index in keys:
+                step = plans[index].steps[-1]
+                assign(container, step, cast_value(step, values[index]))
+        next_step = _next_step(child, keys)
+        if next_step is not None:
+            _write(
+                child, get_or_create(
+                    container, child.step, next_step,
+                    child.obj_type if obj_type is None else obj_type
+                ), values, keys, plans, obj_type
+            )
+
+
+def write_values(trie, root, values, plans, obj_type=None):
+    """
+    Put the values to the root object along the prefix tree.
+
+    The intermediate objects shared by the targets are resolved or created
+    at most once, and the subtrees that don't have any values to put are
+    skipped.
+
+    Parameters:
+        trie: TrieNode built from the plans.
+        root: The root object.
+        values: The dict of field index -> value to put.
+        plans: The mapping of field index -> PathPlan.
+        obj_type: The type used when an intermediate object should be
+            created, but the cast is not specified. By default, the type of
+            the node is used.
+
+    """
+    _write(trie, root, values, frozenset(values), plans, obj_type)
@@ -46,6 +46,10 @@ setup(
     packages=find_packages(exclude=["tests"]),
     include_package_data=True,
     install_requires=dependencies,
+    extras_require={
+        "numpy": ["numpy"],
+        "parallel": ["futures; python_version < '3'"]
+    },
     zip_safe=False,
     author=author,
     author_email=author_email,
@@ -0,0 +1,123 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""asyncio support tests."""
+
+import json
+import unittest as ut
+
+import omm
+from omm.batch import DictLoader
+from omm.structures import ThreadPoolExecutor
+
+try:
+    import asyncio
+    from omm.aio import AsyncMixin, prefetch_async
+except (ImportError, SyntaxError):
+    asyncio = AsyncMixin = None
+
+if AsyncMixin is not None:
+    class UserMapper(AsyncMixin, omm.Mapper):
+        """User mapper."""
+
+        name = omm.MapField("user.name")
+        age = omm.MapField("user.age", set_cast=int)
+
+
+@ut.skipIf(AsyncMixin is None, "asyncio is required")
+class AsyncTestBase(ut.TestCase):
+    """The base of asyncio tests."""
+
+    def setUp(self):
+        """Setup."""
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.addCleanup(asyncio.set_event_loop, None)
+        self.addCleanup(self.loop.close)
+
+    def run_until_complete(self, coro):
+        """Run the coroutine on the loop."""
+        return self.loop.run_until_complete(coro)
+
+
+class ToDictAsyncTest(AsyncTestBase):
+    """to_dict_async test."""
+
+    def setUp(self):
+        """Setup."""
+        super(ToDictAsyncTest, self).setUp()
+        self.name = {"user": {"name": "Test"}}
+        self.age = {"user": {"age": 20}}
+
+    def test_awaitable(self):
+        """The awaitables should be gathered before serialization."""
+        future = self.loop.create_future()
+        self.loop.call_soon(future.set_result, self.age)
+        dct = omm.ConDict({
+            "name": asyncio.sleep(0, result=self.name), "age": future
+        })
+        mapper = UserMapper(dct)
+        self.assertDictEqual(
+            self.run_until_complete(mapper.to_dict_async()),
+            {"name": "Test", "age": 20}
+        )
+        self.assertIs(dct.data["age"], self.age)
+
+    @ut.skipIf(ThreadPoolExecutor is None, "concurrent.futures is required")
+    def test_lazy(self):
+        """Lazy and Future should be resolved without blocking the loop."""
+        with ThreadPoolExecutor(1) as executor:
+            dct = omm.ConDict({
+                "name": omm.Lazy(lambda: self.name),
+                "age": executor.submit(lambda: self.age)
+            })
+            self.run_until_complete(prefetch_async(dct, executor=executor))
+        self.assertDictEqual(
+            dict(dct.data), {"name": self.name, "age": self.age}
+        )
+
+    def test_batch(self):
+        """The missing source of the batch loader should be omitted."""
+        loader = DictLoader({0: self.name})
+        dcts = [
+            omm.ConDict({"name": loader.load(num), "age": self.age})
+            for num in range(2)
+        ]
+        self.assertListEqual([
+            self.run_until_complete(UserMapper(dct).to_dict_async())
+            for dct in dcts
+        ], [{"name": "Test", "age": 20}, {"age": 20}])
+        self.assertListEqual(loader.calls, [[0, 1]])
+
+    def test_object(self):
+        """The mapper connected to the object should be serialized."""
+        mapper = UserMapper(name="Test")
+        self.assertDictEqual(
+            self.run_until_complete(mapper.to_dict_async()), {"name": "Test"}
+        )
+
+
+class FromJSONAsyncTest(AsyncTestBase):
+    """from_json_async test."""
+
+    def setUp(self):
+        """Setup."""
+        super(FromJSONAsyncTest, self).setUp()
+        self.data = json.dumps({"name": "Test", "age": "20"}).encode("utf-8")
+
+    def test_stream(self):
+        """JSON should be read from the stream by the chunks."""
+        stream = asyncio.StreamReader()
+        stream.feed_data(self.data)
+        stream.feed_eof()
+        mapper = self.run_until_complete(
+            UserMapper.from_json_async(stream, chunk_size=4)
+        )
+        self.assertDictEqual(mapper.to_dict(), {"name": "Test", "age": 20})
+
+    def test_bytes(self):
+        """JSON bytes should be de-serialized."""
+        mapper = self.run_until_complete(
+            UserMapper.from_json_async(self.data)
+        )
+        self.assertEqual(mapper.age, 20)
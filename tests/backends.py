@@ -0,0 +1,143 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""JSON backend tests."""
+
+import json
+import unittest as ut
+
+import six
+
+import omm
+from omm import backends
+
+
+class UserMapper(omm.Mapper):
+    """User mapper."""
+
+    name = omm.MapField("user.name")
+    age = omm.MapField("user.age")
+
+
+class RegistryTest(ut.TestCase):
+    """The backend registry test."""
+
+    def setUp(self):
+        """Setup."""
+        self.calls = []
+        backends.register_backend("test", self.dumps, json.loads)
+        self.addCleanup(backends._backends.pop, "test")
+
+    def dumps(self, obj, **kwargs):
+        """Record the call, and dump the object."""
+        self.calls.append(kwargs)
+        return json.dumps(obj, **kwargs)
+
+    def test_stdlib(self):
+        """The standard library should be registered."""
+        self.assertIs(backends.get_backend().dumps, json.dumps)
+        self.assertIn("json", backends.backend_names())
+
+    def test_preference(self):
+        """The first registered backend should be used."""
+        self.assertEqual(
+            backends.get_backend(("missing", "test", "json")).name, "test"
+        )
+
+    def test_unavailable(self):
+        """No available backend should raise ValueError."""
+        with self.assertRaises(ValueError):
+            backends.get_backend(("missing", ))
+
+    def test_dumps_bytes(self):
+        """The default dumps_bytes should encode the result of dumps."""
+        self.assertEqual(
+            backends.get_backend("test").dumps_bytes({"a": u"é"}),
+            json.dumps({"a": u"é"}).encode("utf-8")
+        )
+
+    def test_mapper(self):
+        """The backend of the mapper should be used with the kwargs."""
+        mapper = UserMapper(
+            {"user": {"name": "Test", "age": 20}},
+            json_backend=("missing", "test")
+        )
+        self.assertEqual(
+            mapper.to_json(sort_keys=True),
+            json.dumps({"name": "Test", "age": 20}, sort_keys=True)
+        )
+        self.assertListEqual(self.calls, [{"sort_keys": True}])
+
+    def test_writers(self):
+        """The JSON writers should use the backend of the mapper."""
+        class CompactMapper(UserMapper):
+            json_backend = "compact"
+
+        backends.register_backend("compact", lambda obj, **kwargs: json.dumps(
+            obj, separators=(",", ":"), sort_keys=True, **kwargs
+        ), json.loads)
+        self.addCleanup(backends._backends.pop, "compact")
+        objects = [{"user": {"name": "Test", "age": num}} for num in range(2)]
+        expected = CompactMapper.to_json_array(objects)
+        self.assertEqual(expected, (
+            "[{\"age\":0,\"name\":\"Test\"},"
+            "{\"age\":1,\"name\":\"Test\"}]"
+        ))
+        self.assertEqual(
+            ("").join(CompactMapper.iter_json_array(objects)), expected
+        )
+        stream = six.StringIO()
+        mapper = CompactMapper(objects[0])
+        mapper.write_json(stream)
+        self.assertEqual(stream.getvalue(), mapper.to_json())
+
+
+class MapperJSONTest(ut.TestCase):
+    """The JSON methods of the mapper with the standard library."""
+
+    def setUp(self):
+        """Setup."""
+        self.mapper = UserMapper({"user": {"name": u"Tést", "age": 20}})
+
+    def test_kwargs(self):
+        """The keyword arguments should be passed to json.dumps."""
+        self.assertEqual(
+            self.mapper.to_json(sort_keys=True, indent=2),
+            json.dumps({"name": u"Tést", "age": 20}, sort_keys=True, indent=2)
+        )
+
+    def test_bytes(self):
+        """UTF-8 bytes should be returned."""
+        result = self.mapper.to_json_bytes()
+        self.assertIsInstance(result, bytes)
+        self.assertDictEqual(
+            json.loads(result.decode("utf-8")), {"name": u"Tést", "age": 20}
+        )
+
+    def test_benchmark(self):
+        """The cost of each backend should be reported."""
+        result = backends.benchmark(self.mapper, number=2, names=["json"])
+        self.assertListEqual(list(result), ["json"])
+        self.assertListEqual(
+            list(result["json"]), ["dumps", "dumps_bytes", "loads"]
+        )
+        self.assertTrue(all(cost >= 0 for cost in result["json"].values()))
+
+
+@ut.skipUnless("orjson" in backends.backend_names(), "orjson is required")
+class OrjsonTest(ut.TestCase):
+    """orjson backend test."""
+
+    def test_round_trip(self):
+        """The mapper should be encoded and decoded with orjson."""
+        class OrjsonMapper(UserMapper):
+            json_backend = ("orjson", "json")
+
+        mapper = OrjsonMapper({"user": {"name": u"Tést", "age": 20}})
+        result = mapper.to_json_bytes()
+        self.assertIsInstance(result, bytes)
+        restored = OrjsonMapper.from_json(result)
+        self.assertEqual(restored.name, u"Tést")
+        self.assertEqual(
+            json.loads(mapper.to_json()), {"name": u"Tést", "age": 20}
+        )
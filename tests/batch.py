@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Batch loader tests."""
+
+import unittest as ut
+
+import omm
+from omm.batch import BatchLoader, DictLoader
+
+
+class ArticleMapper(omm.Mapper):
+    """Article mapper."""
+
+    title = omm.MapField("title")
+    author = omm.MapField("name")
+
+
+class DictLoaderTest(ut.TestCase):
+    """BatchLoader test with DictLoader."""
+
+    def setUp(self):
+        """Setup."""
+        self.articles = DictLoader(dict([
+            (num, {"title": ("Article {}").format(num)}) for num in range(6)
+        ]))
+        self.users = DictLoader({0: {"name": "User 0"}, 1: {"name": "User 1"}})
+        self.dcts = [
+            omm.ConDict({
+                "title": self.articles.load(num),
+                "author": self.users.load(num % 3)
+            }) for num in range(6)
+        ]
+
+    def test_to_dicts(self):
+        """Each loader should be called once with the unique keys."""
+        result = ArticleMapper.to_dicts(self.dcts)
+        self.assertListEqual(self.articles.calls, [list(range(6))])
+        self.assertListEqual(self.users.calls, [[0, 1, 2]])
+        self.assertDictEqual(
+            result[4], {"title": "Article 4", "author": "User 1"}
+        )
+        self.assertDictEqual(result[2], {"title": "Article 2"})
+
+    def test_cache(self):
+        """The fetched values shouldn't be fetched again."""
+        self.articles.dispatch()
+        self.assertEqual(self.articles.load(1).loader()["title"], "Article 1")
+        self.articles.clear()
+        self.articles.get(1)
+        self.assertListEqual(self.articles.calls, [list(range(6)), [1]])
+
+    def test_max_batch_size(self):
+        """The keys should be split by max_batch_size."""
+        self.articles.max_batch_size = 4
+        self.articles.get(0)
+        self.assertListEqual(self.articles.calls, [[0, 1, 2, 3], [4, 5]])
+
+    def test_missing(self):
+        """The missing key should raise KeyError."""
+        with self.assertRaises(KeyError):
+            self.users.get(2)
+
+
+class BatchFunctionTest(ut.TestCase):
+    """BatchLoader with the batch function test."""
+
+    def test_list(self):
+        """The list of the values should be matched with the keys."""
+        loader = BatchLoader(lambda keys: [key * 2 for key in keys])
+        sources = [loader.load(key) for key in (1, 2, 1)]
+        self.assertListEqual([source() for source in sources], [2, 4, 2])
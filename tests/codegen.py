@@ -0,0 +1,83 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Generated accessor tests."""
+
+import linecache
+import traceback
+import unittest as ut
+
+import omm
+
+from .mapdata import ArrayMapTestSchema
+
+
+class CodegenMapper(omm.Mapper):
+    """Mapper that generates the accessors."""
+
+    codegen = True
+    array = omm.MapField("test.array[1][1].correct")
+    last_array = omm.MapField("test.array[1][2]")
+    name = omm.MapField("test.user.name", set_cast=str)
+    age = omm.MapField("test age", sep_char=" ")
+
+
+class CodegenAccessorTest(ut.TestCase):
+    """Generated getter and setter test."""
+
+    def test_get(self):
+        """The generated getter should get the values."""
+        for type_dict in (False, True):
+            mapper = CodegenMapper(
+                ArrayMapTestSchema.generate_test_data(type_dict)
+            )
+            self.assertIs(mapper.array, True)
+            self.assertEqual(mapper.last_array, "Hello World")
+
+    def test_set_object(self):
+        """The generated setter should create the objects."""
+        mapper = CodegenMapper()
+        mapper.array = False
+        mapper.name = 123
+        mapper.age = 20
+        result = mapper.connected_object
+        self.assertIsNone(result.test.array[0])
+        self.assertIs(result.test.array[1][1].correct, False)
+        self.assertEqual(result.test.user.name, "123")
+        self.assertEqual(result.test.age, 20)
+
+    def test_set_dict(self):
+        """The generated setter should create the dicts."""
+        mapper = CodegenMapper(asdict=True)
+        mapper.last_array = "Hello World"
+        mapper.name = 123
+        self.assertDictEqual(mapper.connected_object, {
+            "test": {
+                "array": [None, [None, None, "Hello World"]],
+                "user": {"name": "123"}
+            }
+        })
+
+
+class CodegenSourceTest(ut.TestCase):
+    """The generated source should be readable."""
+
+    def test_linecache(self):
+        """The source should be registered to linecache."""
+        getter = CodegenMapper.name._compiled[1]
+        filename = getter.__code__.co_filename
+        self.assertIn("test.user.name", filename)
+        self.assertEqual(
+            linecache.getline(filename, 2).strip(),
+            "data = data['test'] if isinstance(data, dict) else data.test"
+        )
+
+    def test_traceback(self):
+        """The traceback should contain the generated line."""
+        mapper = CodegenMapper(object())
+        try:
+            print(mapper.name)
+        except AttributeError:
+            self.assertIn("else data.test", traceback.format_exc())
+        else:
+            self.fail("AttributeError should be raised.")
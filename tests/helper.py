@@ -3,12 +3,13 @@
 
 """Helper tests."""
 
+import json
 import omm.helper
 import unittest as ut
 try:
-    from unittest.mock import MagicMock, call
+    from unittest.mock import MagicMock, call, patch
 except ImportError:
-    from mock import MagicMock, call
+    from mock import MagicMock, call, patch
 
 
 class ReduceWithoutInitTest(ut.TestCase):
@@ -93,3 +94,106 @@ class ShrinkListShrinkWithValue(ut.TestCase):
         """The result should be shrinked."""
         result = self.shrink_list(self.data, value="a")
         self.assertListEqual(result, self.correct)
+
+
+class IsEmptyTest(ut.TestCase):
+    """Test for is_empty."""
+
+    def setUp(self):
+        """Setup."""
+        self.is_empty = omm.helper.is_empty
+        self.Slotted = type("Slotted", (object, ), {"__slots__": ("test", )})
+
+    def test_dict(self):
+        """The dict should be checked by its elements."""
+        self.assertTrue(self.is_empty({}))
+        self.assertFalse(self.is_empty({"test": None}))
+
+    def test_slots(self):
+        """The attributes in __slots__ should be taken into account."""
+        obj = self.Slotted()
+        self.assertTrue(self.is_empty(obj))
+        obj.test = None
+        self.assertFalse(self.is_empty(obj))
+
+    def test_dict_attr(self):
+        """The attributes in __dict__ should be taken into account."""
+        obj = type("Obj", (object, ), {})()
+        self.assertTrue(self.is_empty(obj))
+        obj.test = None
+        self.assertFalse(self.is_empty(obj))
+
+
+class HookDispatcherTest(ut.TestCase):
+    """Test for HookDispatcher."""
+
+    def setUp(self):
+        """Setup."""
+        class Value(object):
+            def to_json(self):
+                return "{\"test\": true}"
+
+            def to_dict(self):
+                return {"test": False}
+
+        self.Value = Value
+        self.dispatcher = omm.helper.HookDispatcher(
+            ((json.loads, "to_json"), (None, "to_dict"))
+        )
+
+    def test_hook(self):
+        """The first hook the value has should be used."""
+        self.assertDictEqual(self.dispatcher(self.Value()), {"test": True})
+        self.assertEqual(
+            self.dispatcher.memo[self.Value], (json.loads, "to_json")
+        )
+
+    def test_no_hook(self):
+        """The value should be returned as it is, and remembered."""
+        self.assertEqual(self.dispatcher(1), 1)
+        self.assertIsNone(self.dispatcher.memo[int])
+
+    def test_memo(self):
+        """The hook should be looked up once per type."""
+        with patch.object(
+            self.dispatcher, "find", wraps=self.dispatcher.find
+        ) as find:
+            for value in (1, 2, "test", self.Value(), self.Value()):
+                self.dispatcher(value)
+        self.assertEqual(find.call_count, 3)
+
+    def test_proxy(self):
+        """The hook the proxy forwards should be used."""
+        class Proxy(object):
+            def __init__(self, target):
+                self.__target = target
+
+            def __getattr__(self, name):
+                return getattr(self.__target, name)
+
+        for _ in range(2):
+            self.assertDictEqual(
+                self.dispatcher(Proxy(self.Value())), {"test": True}
+            )
+        self.assertIsInstance(self.dispatcher(Proxy(1)), Proxy)
+
+    def test_instance_attr(self):
+        """The hook the instance has should be used."""
+        obj = type("Obj", (object, ), {})()
+        obj.to_dict = lambda: {"test": None}
+        self.assertDictEqual(self.dispatcher(obj), {"test": None})
+
+
+class JoinChunksTest(ut.TestCase):
+    """Test for join_chunks."""
+
+    def test_join(self):
+        """The fragments should be joined into the chunks."""
+        self.assertListEqual(
+            list(omm.helper.join_chunks(["ab", "c", "def", "g"], 3)),
+            ["abc", "def", "g"]
+        )
+
+    def test_empty(self):
+        """No chunk should be generated."""
+        self.assertListEqual(list(omm.helper.join_chunks(["", ""], 3)), [])
@@ -0,0 +1,102 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Batch serialization tests."""
+
+import json
+import types
+import unittest as ut
+
+import six
+
+import omm
+
+
+class UserMapper(omm.Mapper):
+    """User mapper."""
+
+    name = omm.MapField("user.name")
+    age = omm.MapField("user.age", exclude={"json": True})
+
+
+class BatchSerializationTest(ut.TestCase):
+    """to_dicts / iter_dicts / to_json_array test."""
+
+    def setUp(self):
+        """Setup."""
+        self.objects = [
+            {"user": {"name": ("User {}").format(num), "age": num}}
+            for num in range(3)
+        ]
+
+    def test_to_dicts(self):
+        """The result should be the same as to_dict of each mapper."""
+        self.assertListEqual(
+            UserMapper.to_dicts(self.objects),
+            [UserMapper(obj).to_dict() for obj in self.objects]
+        )
+
+    def test_iter_dicts(self):
+        """The objects should be serialized lazily."""
+        result = UserMapper.iter_dicts(iter(self.objects))
+        self.assertIsInstance(result, types.GeneratorType)
+        self.assertDictEqual(next(result), {"name": "User 0", "age": 0})
+
+    def test_to_json_array(self):
+        """The result should be a JSON array with json exclusion."""
+        self.assertListEqual(
+            json.loads(UserMapper.to_json_array(self.objects)),
+            [{"name": ("User {}").format(num)} for num in range(3)]
+        )
+
+    def test_kwargs(self):
+        """The keyword arguments should be passed to json.dumps."""
+        self.assertEqual(
+            UserMapper.to_json_array(self.objects[:1], indent=1),
+            json.dumps([{"name": "User 0"}], indent=1)
+        )
+
+    def test_missing(self):
+        """The unresolved fields should be omitted per object."""
+        self.assertListEqual(
+            UserMapper.to_dicts([{"user": {"name": "Test", "age": 1}}, None]),
+            [{"name": "Test", "age": 1}, {}]
+        )
+
+
+class JSONLinesTest(ut.TestCase):
+    """iter_jsonl / read_jsonl test."""
+
+    def setUp(self):
+        """Setup."""
+        self.fp = six.StringIO()
+
+    def test_write(self):
+        """Each object should be written in a line."""
+        count = UserMapper.iter_jsonl((
+            {"user": {"name": ("User {}").format(num), "age": num}}
+            for num in range(3)
+        ), self.fp)
+        self.assertEqual(count, 3)
+        self.assertListEqual(
+            [json.loads(line) for line in self.fp.getvalue().splitlines()],
+            [{"name": ("User {}").format(num)} for num in range(3)]
+        )
+
+    def test_read(self):
+        """The mappers should be restored lazily."""
+        self.fp.write("{\"name\": \"User 0\"}\n\n{\"name\": \"User 1\"}\n")
+        self.fp.seek(0)
+        result = UserMapper.read_jsonl(self.fp)
+        self.assertIsInstance(result, types.GeneratorType)
+        self.assertListEqual(
+            [mapper.name for mapper in result], ["User 0", "User 1"]
+        )
+
+    def test_round_trip(self):
+        """The written lines should be read back."""
+        UserMapper.iter_jsonl([{"user": {"name": "Test", "age": 20}}], self.fp)
+        self.fp.seek(0)
+        (result, ) = UserMapper.read_jsonl(self.fp)
+        self.assertEqual(result.name, "Test")
+        self.assertFalse(hasattr(result, "age"))
@@ -0,0 +1,231 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Columnar conversion tests."""
+
+import array
+import math
+import unittest as ut
+
+import omm
+from omm import columns
+
+
+class Record(object):
+    """The object that has the keyword arguments as the attributes."""
+
+    def __init__(self, **kwargs):
+        """Init."""
+        self.__dict__.update(kwargs)
+
+
+class AmountMapper(omm.Mapper):
+    """Amount mapper."""
+
+    name = omm.MapField("account.name")
+    recent = omm.MapField("amount.recent", set_cast=float)
+    prev = omm.MapField("amount.prev", set_cast=float)
+    count = omm.MapField("count", set_cast=int)
+    note = omm.MapField("note", exclude={"dict": True})
+
+
+class ToColumnsTest(ut.TestCase):
+    """Mapper.to_columns test."""
+
+    def setUp(self):
+        """Setup."""
+        self.objects = [{
+            "account": {"name": ("Account {}").format(num)},
+            "amount": {"recent": num * 1.5, "prev": float(num)},
+            "count": num, "note": "test"
+        } for num in range(3)]
+
+    def assert_numeric(self, column, typecode, expected):
+        """Check the column is the numeric array."""
+        if columns.numpy is None:
+            self.assertIsInstance(column, array.array)
+            self.assertEqual(column.typecode, typecode)
+        else:
+            self.assertIsInstance(column, columns.numpy.ndarray)
+        self.assertListEqual(list(column), expected)
+
+    def test_columns(self):
+        """The columns should be made for the fields."""
+        result = AmountMapper.to_columns(self.objects)
+        self.assertSetEqual(
+            set(result), set(["name", "recent", "prev", "count"])
+        )
+        self.assertListEqual(
+            result["name"], [("Account {}").format(num) for num in range(3)]
+        )
+        self.assert_numeric(result["recent"], "d", [0.0, 1.5, 3.0])
+        self.assert_numeric(result["prev"], "d", [0.0, 1.0, 2.0])
+        self.assert_numeric(
+            result["count"], columns._typecodes[int], [0, 1, 2]
+        )
+
+    def test_missing(self):
+        """The missing values should be NaN or None."""
+        result = AmountMapper.to_columns([
+            Record(amount=Record()), self.objects[1]
+        ])
+        self.assertTrue(math.isnan(result["recent"][0]))
+        self.assertListEqual(result["count"], [None, 1])
+        self.assertListEqual(result["name"], [None, "Account 1"])
+
+    def test_get_cast(self):
+        """The column should be made from the type of get_cast."""
+        class CastMapper(omm.Mapper):
+            code = omm.MapField("code", set_cast=int, get_cast=str)
+            amount = omm.MapField("amount", set_cast=str, get_cast=float)
+
+        result = CastMapper.to_columns([
+            {"code": 1, "amount": "1.5"}, {"code": 2, "amount": "2"}
+        ])
+        self.assertListEqual(result["code"], ["1", "2"])
+        self.assert_numeric(result["amount"], "d", [1.5, 2.0])
+        self.assertListEqual(
+            [obj.code for obj in CastMapper.from_columns(result)], [1, 2]
+        )
+
+    def test_empty(self):
+        """The empty columns should be made."""
+        result = AmountMapper.to_columns([])
+        self.assertListEqual(result["name"], [])
+        self.assertEqual(len(result["recent"]), 0)
+
+    def test_exclude_type(self):
+        """The columns should follow exclude_type."""
+        self.assertListEqual(
+            AmountMapper.to_columns(self.objects[:1], "json")["note"],
+            ["test"]
+        )
+
+
+class MakeColumnTest(ut.TestCase):
+    """make_column test."""
+
+    def test_invalid(self):
+        """The values that can't be in an array should be in a list."""
+        self.assertListEqual(
+            columns.make_column([1, "test"], int), [1, "test"]
+        )
+
+    def test_leaf_cast(self):
+        """The last cast should be returned."""
+        self.assertIs(columns.leaf_cast(
+            omm.MapField("amount.prev", set_cast=[dict, dict, float])
+        ), float)
+        self.assertIsNone(columns.leaf_cast(AmountMapper.name))
+
+
+class Money(object):
+    """The value restored with from_dict."""
+
+    def __init__(self, amount):
+        """Init."""
+        self.amount = amount
+
+    @classmethod
+    def from_dict(cls, dct):
+        """Restore the value."""
+        return cls(list(dct.values())[0])
+
+
+class FromColumnsTest(ut.TestCase):
+    """Mapper.from_columns test."""
+
+    def setUp(self):
+        """Setup."""
+        self.columns = {
+            "name": ["Account 0", "Account 1"],
+            "recent": array.array("d", [1.5, 2.5]),
+            "prev": ["1", None],
+            "count": [1, 2],
+            "unknown": [True, False]
+        }
+
+    def test_objects(self):
+        """The objects should be built with the casts."""
+        (first, second) = AmountMapper.from_columns(self.columns)
+        self.assertEqual(first.account.name, "Account 0")
+        self.assertEqual(first.amount.recent, 1.5)
+        self.assertIs(type(first.amount.prev), float)
+        self.assertEqual(first.amount.prev, 1.0)
+        self.assertFalse(hasattr(second.amount, "prev"))
+        self.assertIs(type(first.amount), type(second.amount))
+
+    def test_dicts(self):
+        """The dicts should be built if asdict is set."""
+        result = list(AmountMapper.from_columns(self.columns, asdict=True))
+        self.assertDictEqual(result[1], {
+            "account": {"name": "Account 1"},
+            "amount": {"recent": 2.5}, "count": 2
+        })
+
+    def test_round_trip(self):
+        """The result of to_columns should be restored."""
+        objects = [{
+            "account": {"name": "Test"},
+            "amount": {"recent": 1.0, "prev": 2.0}, "count": 3
+        }]
+        result = AmountMapper.from_columns(
+            AmountMapper.to_columns(objects), asdict=True
+        )
+        self.assertListEqual(list(result), objects)
+
+    def test_round_trip_missing(self):
+        """The missing float values (NaN) should stay missing."""
+        objects = [
+            Record(amount=Record(recent=1.0), count=3),
+            Record(amount=Record(recent=2.0, prev=1.0), count=4)
+        ]
+        result = AmountMapper.from_columns(
+            AmountMapper.to_columns(objects), asdict=True
+        )
+        self.assertListEqual(list(result), [
+            {"amount": {"recent": 1.0}, "count": 3},
+            {"amount": {"recent": 2.0, "prev": 1.0}, "count": 4}
+        ])
+
+    def test_length(self):
+        """The columns of different length should raise ValueError."""
+        self.columns["count"].append(3)
+        with self.assertRaises(ValueError):
+            AmountMapper.from_columns(self.columns)
+
+    def test_hook(self):
+        """The cast that has from_dict should restore each value."""
+        class MoneyMapper(omm.Mapper):
+            amount = omm.MapField("amount", set_cast=Money)
+
+        (result, ) = MoneyMapper.from_columns({"amount": [10]})
+        self.assertIsInstance(result.amount, Money)
+        self.assertEqual(result.amount.amount, 10)
+
+
+class CastColumnTest(ut.TestCase):
+    """columns.cast_column test."""
+
+    def test_list(self):
+        """The NaN and None in the list should be None."""
+        self.assertListEqual(
+            columns.cast_column([1.0, float("nan"), None, 2.5], int),
+            [1, None, None, 2]
+        )
+
+    @ut.skipUnless(columns.numpy, "NumPy is required")
+    def test_array(self):
+        """The array should be casted into the Python values."""
+        result = columns.cast_column(columns.numpy.array([1.0, 2.0]), int)
+        self.assertListEqual(result, [1, 2])
+        self.assertTrue(all(type(value) is int for value in result))
+
+    @ut.skipUnless(columns.numpy, "NumPy is required")
+    def test_array_nan(self):
+        """The NaN in the array should be None."""
+        self.assertListEqual(
+            columns.cast_column(
+                columns.numpy.array([1.5, float("nan")]), float
+            ), [1.5, None]
+        )
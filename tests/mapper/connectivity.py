@@ -5,7 +5,12 @@
 """Mapper test case."""
 
 import unittest
-from omm import Mapper
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+from omm import ConDict, MapField, Mapper
 
 
 class MapperConnectivityTest(unittest.TestCase):
@@ -37,3 +42,48 @@ class MapperLazyConnectivityTest(unittest.TestCase):
         mapper = type("TestMap", (Mapper, ), {})()
         mapper.connect(self.test_class)
         self.assertIs(mapper.connected_object, self.test_class)
+
+
+class MapperCursorTest(unittest.TestCase):
+    """Mapper.cursor / rebind test."""
+
+    def setUp(self):
+        """Setup."""
+        class TestMapper(Mapper):
+            name = MapField("test.name")
+
+        self.Mapper = TestMapper
+        self.objects = [
+            {"test": {"name": ("Test {}").format(num)}} for num in range(3)
+        ]
+
+    def test_cursor(self):
+        """The same mapper should be re-connected to each object."""
+        mappers = []
+        names = []
+        for mapper in self.Mapper.cursor(self.objects):
+            mappers.append(mapper)
+            names.append(mapper.name)
+        self.assertEqual(len(set(id(mapper) for mapper in mappers)), 1)
+        self.assertListEqual(names, ["Test 0", "Test 1", "Test 2"])
+
+    def test_rebind(self):
+        """The objects should be connected with rebind."""
+        with patch.object(
+            self.Mapper, "rebind", autospec=True,
+            side_effect=Mapper.rebind
+        ) as rebind:
+            result = [
+                mapper.to_dict() for mapper in self.Mapper.cursor(
+                    self.objects, check=False, asdict=True
+                )
+            ]
+        self.assertEqual(rebind.call_count, 3)
+        self.assertDictEqual(result[2], {"name": "Test 2"})
+
+    def test_condict(self):
+        """The ConDict should be assigned to the mapper by the cursor."""
+        dct = ConDict({"name": {"test": {"name": "Test"}}})
+        (mapper, ) = self.Mapper.cursor([dct])
+        self.assertIs(dct.model, mapper)
+        self.assertIs(self.Mapper().rebind(dct).connected_object, dct)
@@ -4,6 +4,11 @@
 """Mapper errors property unit tests."""
 
 import unittest as ut
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
 import omm
 
 
@@ -23,3 +28,49 @@ class MapperNoErrorTest(ut.TestCase):
         with self.assertRaises(NotImplementedError) as e:
             self.schema.errors
         self.assertEqual(str(e.exception), "Execute validate method first.")
+
+
+class ValidationCacheTest(ut.TestCase):
+    """The validation should run once per class."""
+
+    def setUp(self):
+        """Setup."""
+        class TestSchema(omm.Mapper):
+            name = omm.MapField("test.name", set_cast=[dict, dict, str])
+            alias = omm.MapField("test.name", set_cast=[dict, list, str])
+
+        self.Schema = TestSchema
+
+    def test_cache(self):
+        """The fields should be validated only once."""
+        with patch.object(
+            omm.MapField, "validate", autospec=True
+        ) as validate:
+            for _ in range(3):
+                self.Schema().validate()
+        self.assertEqual(
+            validate.call_count, len(self.Schema._field_table.names)
+        )
+
+    def test_errors_copied(self):
+        """The errors of an instance shouldn't affect the others."""
+        schema = self.Schema()
+        self.assertFalse(schema.validate())
+        name = next(iter(schema.errors))
+        schema.errors[name].append("test")
+        other = self.Schema()
+        self.assertFalse(other.validate())
+        self.assertNotIn("test", other.errors[name])
+
+    def test_invalidate(self):
+        """The errors should be collected again if the fields are changed."""
+        self.assertFalse(self.Schema().validate())
+        del self.Schema.alias
+        self.assertTrue(self.Schema().validate())
+
+    def test_invalidate_set_cast(self):
+        """The errors should be collected again if set_cast is changed."""
+        self.Schema.alias.set_cast = [dict, dict, str]
+        self.assertTrue(self.Schema().validate())
+        self.Schema.alias.set_cast = [dict, list, int]
+        self.assertFalse(self.Schema().validate())
@@ -0,0 +1,124 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Field table tests."""
+
+import unittest as ut
+
+import omm
+
+
+class FieldNameTest(ut.TestCase):
+    """The fields should know their names."""
+
+    def setUp(self):
+        """Setup."""
+        class TestSchema(omm.Mapper):
+            name = omm.MapField("test.name")
+
+        self.Schema = TestSchema
+
+    def test_name(self):
+        """The name should be set when the class is defined."""
+        self.assertEqual(self.Schema.name.name, "name")
+
+    def test_name_added(self):
+        """The name should be set when the field is added."""
+        self.Schema.age = omm.MapField("test.age")
+        self.assertEqual(self.Schema.age.name, "age")
+
+    def test_condict(self):
+        """The field should be routed by its name in ConDict."""
+        dct = omm.ConDict({"name": {"test": {"name": "Test"}}})
+        schema = self.Schema(dct)
+        self.assertEqual(schema.name, "Test")
+        self.assertIn(self.Schema.name, dct)
+        self.assertDictEqual(schema.to_dict(), {"name": "Test"})
+
+    def test_shared(self):
+        """The field bound to two mappers should use the name of each."""
+        class OtherSchema(omm.Mapper):
+            alias = self.Schema.name
+
+        dct = omm.ConDict({"name": {"test": {"name": "Test"}}})
+        schema = self.Schema(dct)
+        self.assertDictEqual(schema.to_dict(), {"name": "Test"})
+        self.assertIn(self.Schema.name, dct)
+        other = OtherSchema(omm.ConDict())
+        other.alias = "Other"
+        self.assertListEqual(list(other.connected_object), ["alias"])
+        self.assertEqual(other.connected_object["alias"].test.name, "Other")
+        schema = self.Schema(omm.ConDict())
+        schema.name = "Test"
+        self.assertListEqual(list(schema.connected_object), ["name"])
+
+
+class FieldMappingTest(ut.TestCase):
+    """Mapper.fields should be a cached read-only mapping."""
+
+    def setUp(self):
+        """Setup."""
+        class TestSchema(omm.Mapper):
+            name = omm.MapField("test.name")
+            age = omm.MapField("test.age")
+
+        self.Schema = TestSchema
+        self.schema = TestSchema()
+
+    def test_cached(self):
+        """The same mapping should be returned."""
+        self.assertIs(self.schema.fields, self.Schema().fields)
+
+    def test_read_only(self):
+        """The mapping shouldn't be modified."""
+        with self.assertRaises(TypeError):
+            self.schema.fields["test"] = omm.MapField("test.test")
+
+    def test_invalidate(self):
+        """The mapping should be rebuilt when the fields are changed."""
+        fields = self.schema.fields
+        del self.Schema.age
+        self.assertIsNot(self.schema.fields, fields)
+        self.assertListEqual(list(self.schema.fields), ["name"])
+
+
+class FieldInheritanceTest(ut.TestCase):
+    """The fields of the base classes should be collected."""
+
+    def setUp(self):
+        """Setup."""
+        class BaseSchema(omm.Mapper):
+            name = omm.MapField("test.name")
+            age = omm.MapField("test.age")
+
+        class TestSchema(BaseSchema):
+            email = omm.MapField("test.email")
+            age = None
+
+        self.Base = BaseSchema
+        self.Schema = TestSchema
+
+    def test_table(self):
+        """The fields should be ordered from the base class."""
+        self.assertTupleEqual(
+            self.Schema._field_table.names, ("name", "email")
+        )
+        self.assertDictEqual(
+            self.Schema._field_table.index, {"name": 0, "email": 1}
+        )
+
+    def test_to_dict(self):
+        """The inherited fields should be serialized."""
+        schema = self.Schema(name="Test", email="test@example.com")
+        self.assertDictEqual(
+            schema.to_dict(), {"name": "Test", "email": "test@example.com"}
+        )
+
+    def test_base_changed(self):
+        """The subclass should be updated when the base class is changed."""
+        self.Schema().to_dict()
+        self.Base.phone = omm.MapField("test.phone")
+        self.assertTupleEqual(
+            self.Schema._field_table.names, ("name", "phone", "email")
+        )
+        self.assertDictEqual(self.Schema._cache, {})
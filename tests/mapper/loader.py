@@ -0,0 +1,79 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compiled loader tests."""
+
+import unittest as ut
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+import omm
+
+from ..mapdata import InvalidCastingLengthTestSchema
+
+
+class LoaderCacheTest(ut.TestCase):
+    """The compiled loader should be cached per class."""
+
+    def setUp(self):
+        """Setup."""
+        class TestMapper(omm.Mapper):
+            name = omm.MapField("test.name", set_cast=str)
+            age = omm.MapField("test.age", exclude_deserialize=True)
+
+        self.Schema = TestMapper
+
+    def test_cache(self):
+        """The loader should be compiled once per exclude_type."""
+        self.Schema.from_dict({"name": "Test"})
+        self.Schema.from_dict({"name": "Test"})
+        self.assertEqual(len([
+            key for key in self.Schema._cache if key[0] == "loader"
+        ]), 1)
+
+    def test_validate_once(self):
+        """The fields should be validated only when compiling."""
+        with patch.object(
+            omm.MapField, "validate", autospec=True
+        ) as validate:
+            for _ in range(3):
+                self.Schema.from_dict({"name": "Test"})
+        self.assertEqual(validate.call_count, 1)
+
+    def test_load(self):
+        """Accepted keys should be restored and the others ignored."""
+        result = self.Schema.from_dict({
+            "name": 123, "age": 20, "unknown": True
+        })
+        self.assertEqual(result.name, "123")
+        self.assertFalse(hasattr(result.connected_object.test, "age"))
+
+    def test_no_value(self):
+        """The mapper shouldn't be connected if no value is restored."""
+        result = self.Schema.from_dict({"age": 20})
+        self.assertIsNone(result.connected_object)
+
+    def test_set_cast_changed(self):
+        """The loader should be compiled again if set_cast is changed."""
+        self.Schema.from_dict({"name": "Test"})
+        self.Schema.name.set_cast = int
+        self.assertEqual(self.Schema.from_dict({"name": "7"}).name, 7)
+
+
+class InvalidCastLoaderTest(ut.TestCase):
+    """The loader should raise ValueError for invalid fields."""
+
+    def test_invalid(self):
+        """The error should be raised."""
+        with self.assertRaises(ValueError):
+            InvalidCastingLengthTestSchema.from_dict({"name": "Test"})
+
+    def test_invalid_name(self):
+        """The field that isn't an identifier should raise the error."""
+        Schema = type("Schema", (omm.Mapper, ), {
+            "my-field": omm.MapField("q", set_cast=[dict])
+        })
+        with self.assertRaises(ValueError):
+            Schema.from_dict({"my-field": 1})
@@ -0,0 +1,76 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Generated object type tests."""
+
+import unittest as ut
+
+import omm
+from omm.trie import GeneratedObject
+
+
+class AccountMapper(omm.Mapper):
+    """Account mapper."""
+
+    name = omm.MapField("user.name")
+    email = omm.MapField("user.contact.email")
+    phone = omm.MapField("user.contact.phone")
+
+
+class ObjectTypeTest(ut.TestCase):
+    """The intermediate objects should use the cached types."""
+
+    def setUp(self):
+        """Setup."""
+        self.mapper = AccountMapper()
+        self.mapper.name = "Test"
+        self.mapper.email = "test@example.com"
+
+    def test_reuse(self):
+        """The same type should be used across the instances."""
+        other = AccountMapper()
+        other.phone = "000-0000"
+        for (result, expected) in zip(
+            (self.mapper.connected_object, other.connected_object),
+            (other.connected_object, self.mapper.connected_object)
+        ):
+            self.assertIs(type(result), type(expected))
+            self.assertIs(type(result.user), type(expected.user))
+            self.assertIs(
+                type(result.user.contact), type(expected.user.contact)
+            )
+
+    def test_slots(self):
+        """The types should have the attributes of the node as slots."""
+        root = self.mapper.connected_object
+        self.assertIsInstance(root, GeneratedObject)
+        self.assertTupleEqual(type(root).__slots__, ("user", ))
+        self.assertTupleEqual(type(root.user).__slots__, ("contact", "name"))
+        self.assertFalse(vars(root.user))
+
+    def test_bulk(self):
+        """update() should use the same types."""
+        other = AccountMapper()
+        other.update({"name": "Test", "phone": "000-0000"})
+        self.assertIs(
+            type(other.connected_object.user),
+            type(self.mapper.connected_object.user)
+        )
+
+    def test_asdict(self):
+        """The dicts should be created if asdict is set."""
+        mapper = AccountMapper(asdict=True)
+        mapper.email = "test@example.com"
+        self.assertDictEqual(
+            mapper.connected_object,
+            {"user": {"contact": {"email": "test@example.com"}}}
+        )
+
+    def test_clear_parent(self):
+        """The object should be treated as empty with no slot values."""
+        AccountMapper.phone.clear_parent = True
+        self.addCleanup(delattr, AccountMapper.phone, "clear_parent")
+        self.mapper.phone = "000-0000"
+        del self.mapper.email
+        del self.mapper.phone
+        self.assertFalse(hasattr(self.mapper.connected_object.user, "contact"))
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Parallel conversion tests."""
+
+import pickle
+import unittest as ut
+
+import omm
+from omm.parallel import ProcessPoolExecutor, iter_chunks
+
+
+class AccountMapper(omm.Mapper):
+    """Account mapper."""
+
+    name = omm.MapField("user.name")
+    email = omm.MapField("user.contact.email", exclude={"dict": True})
+    age = omm.MapField("user.age", set_cast=int)
+
+
+class IterChunksTest(ut.TestCase):
+    """iter_chunks test."""
+
+    def test_chunks(self):
+        """The iterable should be split into the lists."""
+        self.assertListEqual(
+            list(iter_chunks(iter(range(5)), 2)), [[0, 1], [2, 3], [4]]
+        )
+
+
+class PickleTest(ut.TestCase):
+    """The mappers connected to the generated objects should be pickled."""
+
+    def test_pickle(self):
+        """The generated types should be restored from the mapper."""
+        mapper = AccountMapper(name="Test", email="test@example.com")
+        result = pickle.loads(pickle.dumps(mapper))
+        self.assertEqual(result.email, "test@example.com")
+        self.assertIs(
+            type(result.connected_object.user.contact),
+            type(mapper.connected_object.user.contact)
+        )
+
+
+@ut.skipIf(ProcessPoolExecutor is None, "concurrent.futures is required")
+class MapParallelTest(ut.TestCase):
+    """Mapper.map_parallel test."""
+
+    def setUp(self):
+        """Setup."""
+        self.objects = [
+            {"user": {
+                "name": ("User {}").format(num), "age": num,
+                "contact": {"email": "test@example.com"}
+            }} for num in range(10)
+        ]
+
+    def test_to_dict(self):
+        """The result should be the same as to_dicts in order."""
+        self.assertListEqual(
+            list(AccountMapper.map_parallel(
+                self.objects, workers=2, chunksize=3
+            )), AccountMapper.to_dicts(self.objects)
+        )
+
+    def test_unordered(self):
+        """The results should be yielded as the chunks are completed."""
+        result = list(AccountMapper.map_parallel(
+            self.objects, workers=2, chunksize=3, ordered=False
+        ))
+        self.assertEqual(
+            sorted(result, key=lambda dct: dct["age"]),
+            AccountMapper.to_dicts(self.objects)
+        )
+
+    def test_from_dict(self):
+        """The dicts should be deserialized with the exclusion."""
+        dicts = [
+            {"name": "User", "age": str(num), "email": "test@example.com"}
+            for num in range(4)
+        ]
+        result = list(AccountMapper.map_parallel(
+            dicts, workers=2, chunksize=3, method="from_dict"
+        ))
+        self.assertListEqual([mapper.age for mapper in result], [0, 1, 2, 3])
+        self.assertListEqual(
+            [mapper.to_dict() for mapper in result],
+            [AccountMapper.from_dict(dct).to_dict() for dct in dicts]
+        )
+
+    def test_method(self):
+        """Unknown method should raise ValueError immediately."""
+        with self.assertRaises(ValueError):
+            AccountMapper.map_parallel(self.objects, method="to_json")
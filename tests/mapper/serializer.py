@@ -0,0 +1,165 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Compiled serializer tests."""
+
+import json
+import unittest as ut
+
+import omm
+
+
+class SerializerCacheTest(ut.TestCase):
+    """The compiled serializer should be cached per class."""
+
+    def setUp(self):
+        """Setup."""
+        class TestMapper(omm.Mapper):
+            name = omm.MapField("test.name")
+            age = omm.MapField("test.age", exclude={"json": True})
+
+        self.Schema = TestMapper
+        self.data = {"test": {"name": "Test", "age": 20}}
+        self.schema = self.Schema(self.data)
+
+    def count_serializers(self):
+        """Count the compiled serializers."""
+        return len([
+            key for key in self.Schema._cache if key[0] == "serializer"
+        ])
+
+    def test_cache(self):
+        """The serializer should be compiled once per exclude_type."""
+        self.schema.to_dict()
+        self.schema.to_dict()
+        self.assertEqual(self.count_serializers(), 1)
+        self.schema.to_json()
+        self.assertEqual(self.count_serializers(), 2)
+
+    def test_exclusion(self):
+        """The serializer should be compiled for each exclude_type."""
+        self.assertDictEqual(
+            self.schema.to_dict(), {"name": "Test", "age": 20}
+        )
+        self.assertDictEqual(
+            json.loads(self.schema.to_json()), {"name": "Test"}
+        )
+
+    def test_field_added(self):
+        """The serializer should be rebuilt when a field is added."""
+        self.schema.to_dict()
+        self.Schema.sex = omm.MapField("test.sex")
+        self.data["test"]["sex"] = "Xe"
+        self.assertDictEqual(
+            self.schema.to_dict(), {"name": "Test", "age": 20, "sex": "Xe"}
+        )
+
+    def test_field_removed(self):
+        """The serializer should be rebuilt when a field is removed."""
+        self.schema.to_dict()
+        del self.Schema.age
+        self.assertDictEqual(self.schema.to_dict(), {"name": "Test"})
+
+
+class FieldOptionTest(ut.TestCase):
+    """The mapper should follow the changes of the options of the fields."""
+
+    def setUp(self):
+        """Setup."""
+        class TestSchema(omm.Mapper):
+            x = omm.MapField("a")
+            y = omm.MapField("c")
+
+        self.Schema = TestSchema
+        self.obj = {"a": 1, "b": 2, "c": 3}
+        self.assertDictEqual(
+            self.Schema(self.obj).to_dict(), {"x": 1, "y": 3}
+        )
+
+    def test_target(self):
+        """The new target should be read by to_dict."""
+        self.Schema.x.target = "b"
+        self.assertDictEqual(
+            self.Schema(self.obj).to_dict(), {"x": 2, "y": 3}
+        )
+
+    def test_exclude(self):
+        """The excluded field shouldn't be serialized."""
+        self.Schema.y.exclude = True
+        self.assertDictEqual(self.Schema(self.obj).to_dict(), {"x": 1})
+        del self.Schema.y.exclude
+        self.assertDictEqual(
+            self.Schema(self.obj).to_dict(), {"x": 1, "y": 3}
+        )
+
+    def test_get_cast(self):
+        """The new get_cast should be used by to_dict."""
+        self.Schema.x.get_cast = str
+        self.assertDictEqual(
+            self.Schema(self.obj).to_dict(), {"x": "1", "y": 3}
+        )
+
+    def test_mixin(self):
+        """The field of the plain mixin should update the mapper."""
+        class Common(object):
+            name = omm.MapField("user.name")
+
+        class TestSchema(Common, omm.Mapper):
+            pass
+
+        obj = {"user": {"name": "test", "nick": "nick"}}
+        self.assertDictEqual(TestSchema(obj).to_dict(), {"name": "test"})
+        TestSchema.name.target = "user.nick"
+        self.assertDictEqual(TestSchema(obj).to_dict(), {"name": "nick"})
+
+    def test_inherited(self):
+        """The subclass should follow the field of the base class."""
+        class SubSchema(self.Schema):
+            pass
+
+        self.assertDictEqual(
+            SubSchema(self.obj).to_dict(), {"x": 1, "y": 3}
+        )
+        self.Schema.x.target = "b"
+        self.assertDictEqual(
+            SubSchema(self.obj).to_dict(), {"x": 2, "y": 3}
+        )
+
+
+class ExclusionProjectionTest(ut.TestCase):
+    """The exclusion should be computed once without side effects."""
+
+    def setUp(self):
+        """Setup."""
+        class TestMapper(omm.Mapper):
+            name = omm.MapField("test.name")
+            age = omm.MapField(
+                "test.age", exclude={"json": True},
+                exclude_serialize={"dict": True}
+            )
+
+        self.Schema = TestMapper
+        self.schema = self.Schema({"test": {"name": "Test", "age": 20}})
+
+    def test_not_mutated(self):
+        """The exclude dict of the field shouldn't be modified."""
+        self.assertDictEqual(self.schema.to_dict(), {"name": "Test"})
+        self.assertDictEqual(self.Schema.age.exclude, {"json": True})
+        result = self.Schema.from_dict({"name": "Test", "age": 20})
+        self.assertEqual(result.age, 20)
+
+    def test_shared(self):
+        """The projection should be shared by the hooks."""
+        self.schema.to_dict("json")
+        self.schema.to_json()
+        self.assertListEqual([
+            key for key in self.Schema._cache if key[0] == "projection"
+        ], [("projection", "json", "serialize")])
+
+    def test_reassign(self):
+        """The reassigned exclude dict should be used."""
+        self.assertDictEqual(self.schema.to_dict("json"), {"name": "Test"})
+        self.Schema.age.exclude = dict(self.Schema.age.exclude, json=False)
+        self.assertDictEqual(
+            self.schema.to_dict("json"), {"name": "Test", "age": 20}
+        )
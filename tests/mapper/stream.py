@@ -0,0 +1,117 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Streaming JSON writer tests."""
+
+import json
+import unittest as ut
+
+import six
+try:
+    from unittest.mock import MagicMock
+except ImportError:
+    from mock import MagicMock
+
+import omm
+
+from ..mapdata import (
+    SimpleTestMapper, SimpleTestSchemaWithSimpleCastWithJSONFunction
+)
+
+
+class UserMapper(omm.Mapper):
+    """User mapper."""
+
+    name = omm.MapField("user.name")
+    age = omm.MapField("user.age", exclude={"json": True})
+    nickname = omm.MapField("user.\"nick\"")
+
+
+class User(object):
+    """The user that doesn't have the nickname."""
+
+    def __init__(self, name, age):
+        """Init."""
+        self.name = name
+        self.age = age
+
+
+class WriteJSONTest(ut.TestCase):
+    """Mapper.write_json test."""
+
+    def setUp(self):
+        """Setup."""
+        self.fp = six.StringIO()
+
+    def assert_same(self, mapper):
+        """Check the written JSON is the same as to_json."""
+        mapper.write_json(self.fp)
+        if six.PY2:
+            # The order of the keys of dict is arbitrary on Python 2.
+            self.assertEqual(
+                json.loads(self.fp.getvalue()), json.loads(mapper.to_json())
+            )
+        else:
+            self.assertEqual(self.fp.getvalue(), mapper.to_json())
+
+    def test_simple(self):
+        """The simple mapper should be written."""
+        self.assert_same(
+            SimpleTestMapper(SimpleTestMapper.generate_test_data())
+        )
+
+    def test_hooks(self):
+        """The values should be serialized with the hooks."""
+        Schema = SimpleTestSchemaWithSimpleCastWithJSONFunction
+        schema = Schema()
+        schema.name = "Test"
+        schema.age = 20
+        self.assert_same(schema)
+
+    def test_escape(self):
+        """The keys should be escaped, and excluded ones skipped."""
+        self.assert_same(UserMapper({"user": {
+            "name": "Tést", "age": 20, "\"nick\"": "t"
+        }}))
+
+    def test_empty(self):
+        """The empty object should be written."""
+        self.assert_same(UserMapper())
+
+
+class JSONArrayTest(ut.TestCase):
+    """iter_json_array / write_json_array test."""
+
+    def setUp(self):
+        """Setup."""
+        self.objects = [
+            {"user": User(("User {}").format(num), num)} for num in range(10)
+        ]
+        self.expected = json.dumps(
+            [{"name": ("User {}").format(num)} for num in range(10)]
+        )
+
+    def test_chunks(self):
+        """The array should be generated in chunks."""
+        chunks = list(UserMapper.iter_json_array(self.objects, 50))
+        self.assertEqual(("").join(chunks), self.expected)
+        self.assertGreater(len(chunks), 1)
+        self.assertTrue(all(len(chunk) >= 50 for chunk in chunks[:-1]))
+
+    def test_empty(self):
+        """The empty array should be generated."""
+        self.assertListEqual(list(UserMapper.iter_json_array([])), ["[]"])
+
+    def test_to_json_array(self):
+        """to_json_array should give the same result."""
+        self.assertEqual(UserMapper.to_json_array(self.objects), self.expected)
+
+    def test_write(self):
+        """The chunks should be written and flushed."""
+        fp = MagicMock()
+        UserMapper.write_json_array(self.objects, fp, 50)
+        self.assertEqual(
+            ("").join(call[0][0] for call in fp.write.call_args_list),
+            self.expected
+        )
+        self.assertEqual(fp.flush.call_count, fp.write.call_count)
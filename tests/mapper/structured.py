@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""NumPy structured array tests."""
+
+import unittest as ut
+
+import omm
+from omm.columns import numpy
+
+
+class RecentPrevAmount(omm.Mapper):
+    """Recent / previous amount mapper."""
+
+    recent = omm.MapField("amount.recent", set_cast=float)
+    prev = omm.MapField("amount.prev", set_cast=float)
+    count = omm.MapField("count", set_cast=int)
+    currency = omm.MapField("currency", set_cast=str, dtype="U3")
+
+
+class StringMapper(omm.Mapper):
+    """The mapper that has a string without dtype."""
+
+    name = omm.MapField("name", set_cast=str)
+
+
+@ut.skipUnless(numpy, "NumPy is required")
+class StructuredArrayTest(ut.TestCase):
+    """to_structured_array / from_structured_array test."""
+
+    def setUp(self):
+        """Setup."""
+        self.objects = [{
+            "amount": {"recent": num * 1.5, "prev": float(num)},
+            "count": num, "currency": "JPY"
+        } for num in range(3)]
+
+    def test_dtype(self):
+        """The dtype should be derived from the fields."""
+        result = RecentPrevAmount.to_structured_array(self.objects)
+        self.assertListEqual(
+            list(result.dtype.names), ["recent", "prev", "count", "currency"]
+        )
+        self.assertEqual(result.dtype["recent"], numpy.dtype("f8"))
+        self.assertEqual(result.dtype["count"], numpy.dtype("i8"))
+        self.assertEqual(result.dtype["currency"], numpy.dtype("U3"))
+
+    def test_values(self):
+        """The array should be filled with the values."""
+        result = RecentPrevAmount.to_structured_array(self.objects)
+        self.assertListEqual(result["recent"].tolist(), [0.0, 1.5, 3.0])
+        self.assertEqual(result["count"].sum(), 3)
+        self.assertListEqual(result["currency"].tolist(), ["JPY"] * 3)
+
+    def test_round_trip(self):
+        """The objects should be restored from the array."""
+        result = RecentPrevAmount.from_structured_array(
+            RecentPrevAmount.to_structured_array(self.objects), asdict=True
+        )
+        self.assertListEqual(list(result), self.objects)
+
+    def test_round_trip_missing(self):
+        """The NaN should be restored as the missing value."""
+        values = [RecentPrevAmount(obj).to_dict() for obj in self.objects]
+        del values[0]["prev"]
+        del self.objects[0]["amount"]["prev"]
+        sources = [
+            RecentPrevAmount.from_dict(value).connected_object
+            for value in values
+        ]
+        result = RecentPrevAmount.from_structured_array(
+            RecentPrevAmount.to_structured_array(sources), asdict=True
+        )
+        self.assertListEqual(list(result), self.objects)
+
+    def test_types(self):
+        """The restored values should be Python values."""
+        (result, ) = RecentPrevAmount.from_structured_array(
+            RecentPrevAmount.to_structured_array(self.objects[1:2])
+        )
+        self.assertIs(type(result.amount.recent), float)
+        self.assertIs(type(result.count), int)
+        self.assertIs(type(result.currency), str)
+
+    def test_unsupported(self):
+        """The string without dtype should raise TypeError."""
+        with self.assertRaises(TypeError):
+            StringMapper.to_structured_array([{"name": "Test"}])
+
+
+@ut.skipIf(numpy, "NumPy is installed")
+class NoNumpyTest(ut.TestCase):
+    """The structured array without NumPy."""
+
+    def test_import_error(self):
+        """The structured array should require NumPy."""
+        with self.assertRaises(ImportError):
+            RecentPrevAmount.to_structured_array([])
@@ -134,3 +134,38 @@ class DictInvocationAsAlternativeTest(ut.TestCase):
                 call({"age": self.data["age"]})
             ], any_order=True
         )
+
+
+class FromJSONTest(ut.TestCase):
+    """Mapper.from_json test."""
+
+    def setUp(self):
+        """Setup."""
+        class TestMapper(omm.Mapper):
+            name = omm.MapField("test.name")
+            age = omm.MapField("test.age", exclude={"json": True})
+
+        self.Schema = TestMapper
+
+    def test_decode(self):
+        """The accepted keys should be restored."""
+        result = self.Schema.from_json(
+            "{\"name\": \"Test\", \"age\": 20, \"unknown\": [1]}"
+        )
+        self.assertDictEqual(result.to_dict(), {"name": "Test"})
+        self.assertEqual(result.name, "Test")
+        self.assertFalse(hasattr(result, "age"))
+
+    def test_bytes(self):
+        """The UTF-8 bytes should be decoded."""
+        result = self.Schema.from_json(u"{\"name\": \"Tést\"}".encode(
+            "utf-8"
+        ))
+        self.assertEqual(result.name, u"Tést")
+
+    def test_kwargs(self):
+        """The keyword arguments should be passed to json.loads."""
+        result = self.Schema.from_json(
+            "{\"name\": 1.5}", parse_float=str
+        )
+        self.assertEqual(result.name, "1.5")
@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Bulk assignment tests."""
+
+import unittest as ut
+
+import omm
+
+
+class Counted(object):
+    """The object that counts its instantiation."""
+
+    count = 0
+
+    def __init__(self):
+        """Init."""
+        type(self).count += 1
+
+
+class UserMapper(omm.Mapper):
+    """User mapper."""
+
+    fullname = omm.MapField("full_name")
+    street1 = omm.MapField(
+        "address.street[0]", set_cast=[Counted, Counted, list, str]
+    )
+    street2 = omm.MapField(
+        "address.street[1]", set_cast=[Counted, Counted, list, str]
+    )
+    city = omm.MapField("address.city", set_cast=[Counted, Counted, str])
+    invalid = omm.MapField("address.zip", set_cast=[Counted, str])
+
+
+class UpdateTest(ut.TestCase):
+    """Mapper.update test."""
+
+    def setUp(self):
+        """Setup."""
+        Counted.count = 0
+        self.mapper = UserMapper()
+
+    def test_update(self):
+        """The values should be written."""
+        self.mapper.update({
+            "fullname": "Test Example", "street1": "1-1",
+            "street2": 2, "city": "Tokyo"
+        })
+        result = self.mapper.connected_object
+        self.assertEqual(result.full_name, "Test Example")
+        self.assertListEqual(result.address.street, ["1-1", "2"])
+        self.assertEqual(result.address.city, "Tokyo")
+
+    def test_shared_object(self):
+        """The shared intermediate object should be created once."""
+        self.mapper.update({
+            "street1": "1-1", "street2": "1-2", "city": "Tokyo"
+        })
+        self.assertEqual(Counted.count, 2)
+
+    def test_existing_object(self):
+        """The existing objects should be reused."""
+        self.mapper.update({"street1": "1-1"})
+        address = self.mapper.connected_object.address
+        self.mapper.update({"street2": "1-2", "city": "Tokyo"})
+        self.assertIs(self.mapper.connected_object.address, address)
+        self.assertListEqual(address.street, ["1-1", "1-2"])
+
+    def test_validate_first(self):
+        """Nothing should be written if a field is invalid."""
+        with self.assertRaises(ValueError):
+            self.mapper.update({"city": "Tokyo", "invalid": "000-0000"})
+        self.assertIsNone(self.mapper.connected_object)
+
+    def test_attribute(self):
+        """The keys that are not fields should be set as attributes."""
+        self.mapper.update({"city": "Tokyo", "metadata": {"test": True}})
+        self.assertDictEqual(self.mapper.metadata, {"test": True})
+
+    def test_dict(self):
+        """The dicts should be created if asdict is set."""
+        mapper = omm.Mapper.__class__("DictMapper", (UserMapper, ), {
+            "asdict": True, "fullname": omm.MapField("user.name"),
+            "age": omm.MapField("user.age")
+        })()
+        mapper.update({"fullname": "Test", "age": 20})
+        self.assertDictEqual(
+            mapper.connected_object, {"user": {"name": "Test", "age": 20}}
+        )
+
+    def test_condict(self):
+        """Each value should be written to the corresponding object."""
+        (name, city) = ({}, {})
+        self.mapper.connect(omm.ConDict({"fullname": name, "city": city}))
+        self.mapper.update({"fullname": "Test", "city": "Tokyo"})
+        self.assertDictEqual(name, {"full_name": "Test"})
+        self.assertEqual(city["address"].city, "Tokyo")
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""One-pass field reading tests."""
+
+import unittest as ut
+
+import omm
+
+
+class RecentPrevAmount(object):
+    """Recent and previous amount."""
+
+    def __init__(self, recent, prev):
+        """Init."""
+        self.recent = recent
+        self.prev = prev
+
+
+class AssetInfo(object):
+    """Asset info that counts the access to its members."""
+
+    def __init__(self):
+        """Init."""
+        self.count = {"assets": 0, "cash": 0}
+        self._assets = RecentPrevAmount(10.0, 11.0)
+        self._cash = RecentPrevAmount(12.0, 13.0)
+
+    @property
+    def assets(self):
+        """Return assets."""
+        self.count["assets"] += 1
+        return self._assets
+
+    @property
+    def cash(self):
+        """Return cash."""
+        self.count["cash"] += 1
+        return self._cash
+
+
+class AssetInfoMapper(omm.Mapper):
+    """Asset info mapper."""
+
+    assets_recent = omm.MapField("assets.recent")
+    assets_prev = omm.MapField("assets.prev", get_cast=int)
+    cash_recent = omm.MapField("cash.recent")
+    cash_prev = omm.MapField("cash.prev")
+    missing = omm.MapField("cash.missing")
+
+
+class ValuesTest(ut.TestCase):
+    """Mapper.values test."""
+
+    def setUp(self):
+        """Setup."""
+        self.data = AssetInfo()
+        self.mapper = AssetInfoMapper(self.data)
+
+    def test_values(self):
+        """The values should be read, and get_cast should be applied."""
+        self.assertDictEqual(self.mapper.values(), {
+            "assets_recent": 10.0, "assets_prev": 11,
+            "cash_recent": 12.0, "cash_prev": 13.0
+        })
+
+    def test_shared_node(self):
+        """The shared intermediate objects should be resolved once."""
+        self.mapper.to_dict()
+        self.assertDictEqual(self.data.count, {"assets": 1, "cash": 1})
+
+    def test_not_connected(self):
+        """The values should be empty if the mapper is not connected."""
+        self.assertDictEqual(AssetInfoMapper().values(), {})
+
+    def test_missing_attr(self):
+        """The attributes that the object doesn't have should be omitted."""
+        del self.data._cash.prev
+        self.assertDictEqual(self.mapper.to_dict(), {
+            "assets_recent": 10.0, "assets_prev": 11, "cash_recent": 12.0
+        })
+
+    def test_missing_key(self):
+        """The keys that the dict doesn't have should raise KeyError."""
+        self.mapper.connect({"cash": {"recent": 1.0}})
+        with self.assertRaises(KeyError):
+            self.mapper.to_dict()
+
+    def test_error(self):
+        """The errors except AttributeError should be propagated."""
+        class BrokenInfo(AssetInfo):
+            @property
+            def cash(self):
+                """Raise TypeError."""
+                return 1 + "x"
+
+        self.mapper.connect(BrokenInfo())
+        with self.assertRaises(TypeError):
+            self.mapper.to_dict()
+
+    def test_excluded(self):
+        """The excluded fields shouldn't be looked up."""
+        class ExcludeMapper(omm.Mapper):
+            recent = omm.MapField("cash.recent")
+            prev = omm.MapField("cash.prev", exclude={"dict": True})
+
+        mapper = ExcludeMapper({"cash": {"recent": 1.0}})
+        self.assertDictEqual(mapper.to_dict(), {"recent": 1.0})
+        with self.assertRaises(KeyError):
+            mapper.to_dict("json")
+
+    def test_condict(self):
+        """The values should be read from each connected object."""
+        self.mapper.connect(omm.ConDict({
+            "assets_recent": self.data,
+            "cash_prev": {"cash": {"prev": 1.0}}
+        }))
+        self.assertDictEqual(self.mapper.values(), {
+            "assets_recent": 10.0, "cash_prev": 1.0
+        })
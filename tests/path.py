@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Path plan tests."""
+
+import unittest as ut
+try:
+    from unittest.mock import patch
+except ImportError:
+    from mock import patch
+
+import omm
+from omm.path import PathSegment, PathStep, compile_path
+
+
+class CompilePathTest(ut.TestCase):
+    """compile_path test."""
+
+    def setUp(self):
+        """Setup."""
+        self.Objs = [
+            type(("Obj{}").format(num), (object, ), {}) for num in range(6)
+        ]
+
+    def test_segments(self):
+        """The target should be split into names and indexes."""
+        plan = compile_path("test.users[0][12].name")
+        self.assertTupleEqual(plan.segments, (
+            PathSegment("test", ()), PathSegment("users", (0, 12)),
+            PathSegment("name", ())
+        ))
+
+    def test_steps_with_list_cast(self):
+        """Each step should have the corresponding cast."""
+        plan = compile_path("test.users[1].name", set_cast=self.Objs[:5])
+        self.assertIs(plan.root_cast, self.Objs[0])
+        self.assertEqual(plan.num_cast, 5)
+        self.assertTupleEqual(plan.steps, (
+            PathStep("test", False, self.Objs[1]),
+            PathStep("users", False, self.Objs[2]),
+            PathStep(1, True, self.Objs[3]),
+            PathStep("name", False, self.Objs[4])
+        ))
+
+    def test_steps_with_simple_cast(self):
+        """Only the last step should have the cast."""
+        plan = compile_path("test.name", set_cast=str)
+        self.assertIsNone(plan.root_cast)
+        self.assertTupleEqual(plan.steps, (
+            PathStep("test", False, None), PathStep("name", False, str)
+        ))
+
+    def test_steps_with_short_cast(self):
+        """Casts that are not specified should be None."""
+        plan = compile_path("test.user.name", set_cast=self.Objs[:2])
+        self.assertEqual(plan.num_cast, 4)
+        self.assertListEqual(
+            [step.cast for step in plan.steps], [self.Objs[1], None, None]
+        )
+
+    def test_sep_char(self):
+        """The target should be split by sep_char."""
+        plan = compile_path("test.age", sep_char=" ")
+        self.assertTupleEqual(
+            plan.steps, (PathStep("test.age", False, None), )
+        )
+
+
+class FieldPlanTest(ut.TestCase):
+    """MapField.plan test."""
+
+    def setUp(self):
+        """Setup."""
+        self.field = omm.MapField("test.name")
+
+    def test_cached(self):
+        """The plan should be compiled only once."""
+        self.assertIs(self.field.plan, self.field.plan)
+
+    def test_recompile(self):
+        """The plan should be re-compiled when the target is changed."""
+        plan = self.field.plan
+        self.field.target = "test.user.name"
+        self.assertIsNot(self.field.plan, plan)
+        self.assertEqual(len(self.field.plan.steps), 3)
+
+    def test_recompile_cast(self):
+        """The plan should be re-compiled when set_cast is changed."""
+        plan = self.field.plan
+        self.field.set_cast = str
+        self.assertIsNot(self.field.plan, plan)
+        self.assertIs(self.field.plan.steps[-1].cast, str)
+
+    def test_mapper_compile(self):
+        """The plan should be compiled when the mapper is defined."""
+        class TestMapper(omm.Mapper):
+            name = omm.MapField("test.name")
+
+        self.assertIn("_compiled", vars(TestMapper.name))
+
+    def test_validate_cached(self):
+        """validate() shouldn't parse the target again."""
+        self.field.set_cast = [object, object]
+        self.field.plan
+        with patch("omm.fields.compile_path") as compile_path:
+            for _ in range(2):
+                with self.assertRaises(ValueError) as e:
+                    self.field.validate()
+        self.assertEqual(
+            str(e.exception), "The number of set_cast must be 3, not 2"
+        )
+        compile_path.assert_not_called()
@@ -3,9 +3,12 @@
 
 """Connection dict tests."""
 
-from unittest import TestCase
+import threading
+import time
+from unittest import TestCase, skipIf
 
-from omm import ConDict
+from omm import ConDict, Lazy, MissingSource
+from omm.structures import ThreadPoolExecutor
 
 from ..mapdata import SimpleTestMapper
 
@@ -134,3 +137,91 @@ class ItemIterationTest(TestData):
             [key for key in self.dct],
             [key for key in self.dct.data]
         )
+
+
+class LazySourceTest(TestData):
+    """Lazy source test."""
+
+    def setUp(self):
+        """Setup."""
+        super(LazySourceTest, self).setUp()
+        self.calls = []
+
+        def load(value):
+            def loader():
+                self.calls.append(threading.current_thread())
+                return value
+            return Lazy(loader)
+
+        self.age = {"test": {"age": 29}}
+        self.dct = ConDict({"name": load(self.name), "age": load(self.age)})
+        self.map = SimpleTestMapper(self.dct)
+
+    def test_getitem(self):
+        """The source should be loaded only on first access."""
+        self.assertIs(self.dct["name"], self.name)
+        self.assertIs(self.dct["name"], self.name)
+        self.assertEqual(len(self.calls), 1)
+        self.assertIsInstance(self.dct.data["age"], Lazy)
+
+    def test_prefetch_keys(self):
+        """Only the specified keys should be loaded."""
+        self.dct.prefetch([SimpleTestMapper.age])
+        self.assertIs(self.dct.data["age"], self.age)
+        self.assertIsInstance(self.dct.data["name"], Lazy)
+
+    def test_missing(self):
+        """The missing source should be resolved only once."""
+        calls = []
+
+        def load():
+            calls.append(None)
+            raise MissingSource("name")
+
+        self.dct["name"] = Lazy(load)
+        self.assertDictEqual(self.map.to_dict(), {"age": 29})
+        self.assertDictEqual(self.map.to_dict(), {"age": 29})
+        self.assertEqual(len(calls), 1)
+        self.assertNotIn("name", self.dct)
+        with self.assertRaises(KeyError):
+            self.dct["name"]
+
+    def test_key_error(self):
+        """The KeyError of the loader should be propagated."""
+        self.dct["name"] = Lazy(lambda: {}["name"])
+        with self.assertRaises(KeyError):
+            self.map.to_dict()
+
+    @skipIf(ThreadPoolExecutor is None, "concurrent.futures is required")
+    def test_to_dict(self):
+        """The sources should be loaded concurrently before to_dict."""
+        with ThreadPoolExecutor(2) as executor:
+            self.map.prefetch_executor = executor
+            result = self.map.to_dict()
+        self.assertDictEqual(result, {"name": "test", "age": 29})
+        self.assertEqual(len(self.calls), 2)
+        self.assertNotIn(threading.current_thread(), self.calls)
+
+    @skipIf(ThreadPoolExecutor is None, "concurrent.futures is required")
+    def test_concurrent(self):
+        """The latency should be the longest load."""
+        def load():
+            time.sleep(0.2)
+            return self.name
+
+        dct = ConDict(dict([(key, Lazy(load)) for key in ("a", "b", "c")]))
+        start = time.time()
+        dct.prefetch()
+        self.assertLess(time.time() - start, 0.5)
+        self.assertDictEqual(dict(dct.data), dict.fromkeys("abc", self.name))
+
+    @skipIf(ThreadPoolExecutor is None, "concurrent.futures is required")
+    def test_future(self):
+        """Future should be resolved with its result."""
+        with ThreadPoolExecutor(1) as executor:
+            self.dct["age"] = executor.submit(lambda: self.age)
+            self.assertEqual(self.map.age, 29)
+            self.assertIs(self.dct.data["age"], self.age)
+            self.dct["age"] = executor.submit(lambda: self.age)
+            self.map.to_dict()
+        self.assertIs(self.dct.data["age"], self.age)
@@ -0,0 +1,72 @@
+#!/usr/bin/env python
+# coding=utf-8
+
+"""Prefix tree tests."""
+
+import unittest as ut
+
+from omm.path import compile_path
+from omm.trie import GeneratedObject, build_trie, node_types
+
+
+class BuildTrieTest(ut.TestCase):
+    """build_trie test."""
+
+    def setUp(self):
+        """Setup."""
+        self.trie = build_trie(enumerate([
+            compile_path("assets.recent"), compile_path("assets.prev"),
+            compile_path("cash.recent"), compile_path("cash.history[0]")
+        ]))
+
+    def test_shared_prefix(self):
+        """The fields should share the intermediate nodes."""
+        self.assertListEqual(
+            list(self.trie.children), [("assets", False), ("cash", False)]
+        )
+        assets = self.trie.children[("assets", False)]
+        self.assertListEqual(
+            list(assets.children), [("recent", False), ("prev", False)]
+        )
+
+    def test_fields(self):
+        """The leaves should have the field indexes."""
+        cash = self.trie.children[("cash", False)]
+        history = cash.children[("history", False)]
+        self.assertListEqual(history.fields, [])
+        self.assertListEqual(history.children[(0, True)].fields, [3])
+
+    def test_descendants(self):
+        """The nodes should know the fields under them."""
+        self.assertEqual(self.trie.descendants, frozenset([0, 1, 2, 3]))
+        self.assertEqual(
+            self.trie.children[("cash", False)].descendants,
+            frozenset([2, 3])
+        )
+
+    def test_walk(self):
+        """The nodes should be iterated in pre-order."""
+        self.assertListEqual(
+            [node.step and node.step.key for node in self.trie.walk()],
+            [None, "assets", "recent", "prev", "cash", "recent", "history", 0]
+        )
+
+    def test_obj_type(self):
+        """The nodes that have children should have their own types."""
+        assets = self.trie.children[("assets", False)]
+        self.assertTupleEqual(assets.obj_type.__slots__, ("prev", "recent"))
+        self.assertTrue(issubclass(assets.obj_type, GeneratedObject))
+        self.assertIsNot(
+            assets.obj_type, self.trie.children[("cash", False)].obj_type
+        )
+        self.assertIsNone(assets.children[("recent", False)].obj_type)
+
+    def test_node_types(self):
+        """The types along the plan should be returned."""
+        self.assertTupleEqual(
+            node_types(self.trie, compile_path("assets.prev")),
+            (
+                self.trie.obj_type,
+                self.trie.children[("assets", False)].obj_type, None
+            )
+        )